@@ -14,7 +14,14 @@ Controls:
 import random
 from dataclasses import dataclass
 from enum import Enum
-from typing import Optional
+from typing import Callable, Optional
+
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:  # optional: only used to batch-check conditions
+    np = None
+    njit = None
 
 class Color(Enum):
     RED = "red"
@@ -44,7 +51,26 @@ class WallColor(Enum):
     def __str__(self):
         return self.value
 
-@dataclass
+# Enum members materialized once for menus and index-based choices
+COLORS = tuple(Color)
+OBJECT_TYPES = tuple(ObjectType)
+WALL_COLORS = tuple(WallColor)
+
+# Integer indices used by the counter arrays and bitmasks on House
+COLOR_IDX = {c: i for i, c in enumerate(COLORS)}
+TYPE_IDX = {t: i for i, t in enumerate(OBJECT_TYPES)}
+
+# Opcodes for the flat condition table consumed by check_all_conditions()
+OP_MIN_COLOR = 0
+OP_MAX_COLOR = 1
+OP_MIN_TYPE = 2
+OP_ROOM_HAS_TYPE = 3
+OP_ROOM_HAS_COLOR = 4
+OP_ROOM_NOT_COLOR = 5
+OP_ROOM_MIN = 6
+OP_ROOM_MAX = 7
+
+@dataclass(slots=True)
 class GameObject:
     obj_type: ObjectType
     color: Color
@@ -52,25 +78,35 @@ class GameObject:
     def __str__(self):
         return f"{self.color} {self.obj_type}"
 
-@dataclass 
+def obj_id(obj_type: ObjectType, color: Color) -> int:
+    """Pack an object into a small int: type index in the high bits, color in the low two"""
+    return (TYPE_IDX[obj_type] << 2) | COLOR_IDX[color]
+
+def obj_from_id(oid: int) -> GameObject:
+    return GameObject(OBJECT_TYPES[oid >> 2], COLORS[oid & 3])
+
+@dataclass(slots=True)
 class Room:
     name: str
     wall_color: WallColor
-    objects: list  # List of GameObjects, max 3
+    objects: list  # List of packed object ids (see obj_id), max 3
     
     def __str__(self):
-        obj_str = ", ".join(str(o) for o in self.objects) if self.objects else "empty"
+        obj_str = ", ".join(str(o) for o in self.get_objects()) if self.objects else "empty"
         return f"{self.name} (walls: {self.wall_color}): [{obj_str}]"
     
+    def get_objects(self) -> list:
+        return [obj_from_id(oid) for oid in self.objects]
+    
     def add_object(self, obj: GameObject) -> bool:
         if len(self.objects) < 3:
-            self.objects.append(obj)
+            self.objects.append(obj_id(obj.obj_type, obj.color))
             return True
         return False
     
     def remove_object(self, index: int) -> Optional[GameObject]:
         if 0 <= index < len(self.objects):
-            return self.objects.pop(index)
+            return obj_from_id(self.objects.pop(index))
         return None
 
 class House:
@@ -81,6 +117,58 @@ class House:
             Room("Living Room", WallColor.WHITE, []),
             Room("Kitchen", WallColor.WHITE, [])
         ]
+        # Counters maintained incrementally on every mutation, so condition
+        # checks are a couple of int reads instead of walks over the objects.
+        # Arrays are indexed by COLOR_IDX / TYPE_IDX.
+        n_rooms = len(self.rooms)
+        self.color_counts = [0] * len(COLORS)
+        self.type_counts = [0] * len(OBJECT_TYPES)
+        self.room_color_counts = [[0] * len(COLORS) for _ in range(n_rooms)]
+        self.room_type_counts = [[0] * len(OBJECT_TYPES) for _ in range(n_rooms)]
+        self.room_len = [0] * n_rooms
+        # Presence bitmasks: bit i is set while the room holds at least one
+        # object of color/type i
+        self.room_color_mask = [0] * n_rooms
+        self.room_type_mask = [0] * n_rooms
+        # Bumped on every mutation; lets callers cache results per house state
+        self.version = 0
+    
+    def _count(self, room_index: int, oid: int, delta: int):
+        ci, ti = oid & 3, oid >> 2
+        self.color_counts[ci] += delta
+        self.type_counts[ti] += delta
+        room_colors = self.room_color_counts[room_index]
+        room_types = self.room_type_counts[room_index]
+        room_colors[ci] += delta
+        room_types[ti] += delta
+        if room_colors[ci]:
+            self.room_color_mask[room_index] |= 1 << ci
+        else:
+            self.room_color_mask[room_index] &= ~(1 << ci)
+        if room_types[ti]:
+            self.room_type_mask[room_index] |= 1 << ti
+        else:
+            self.room_type_mask[room_index] &= ~(1 << ti)
+        self.room_len[room_index] += delta
+        self.version += 1
+    
+    def add_object(self, room_index: int, obj: GameObject) -> bool:
+        """Place an object in a room. All mutations go through House so the
+        counters stay in sync with the rooms."""
+        if self.rooms[room_index].add_object(obj):
+            self._count(room_index, obj_id(obj.obj_type, obj.color), 1)
+            return True
+        return False
+    
+    def remove_object(self, room_index: int, index: int) -> Optional[GameObject]:
+        removed = self.rooms[room_index].remove_object(index)
+        if removed:
+            self._count(room_index, obj_id(removed.obj_type, removed.color), -1)
+        return removed
+    
+    def set_wall_color(self, room_index: int, wall_color: WallColor):
+        self.rooms[room_index].wall_color = wall_color
+        self.version += 1
     
     def display(self):
         print("\n" + "="*60)
@@ -93,30 +181,51 @@ class House:
     def get_all_objects(self) -> list:
         all_objs = []
         for room in self.rooms:
-            all_objs.extend(room.objects)
+            all_objs.extend(room.get_objects())
         return all_objs
     
     def count_objects_by_color(self, color: Color) -> int:
-        return sum(1 for obj in self.get_all_objects() if obj.color == color)
+        return self.color_counts[COLOR_IDX[color]]
     
     def count_objects_by_type(self, obj_type: ObjectType) -> int:
-        return sum(1 for obj in self.get_all_objects() if obj.obj_type == obj_type)
+        return self.type_counts[TYPE_IDX[obj_type]]
     
     def count_objects_in_room(self, room_index: int) -> int:
-        return len(self.rooms[room_index].objects)
+        return self.room_len[room_index]
     
     def room_has_object_type(self, room_index: int, obj_type: ObjectType) -> bool:
-        return any(obj.obj_type == obj_type for obj in self.rooms[room_index].objects)
+        return bool(self.room_type_mask[room_index] & (1 << TYPE_IDX[obj_type]))
     
     def room_has_color(self, room_index: int, color: Color) -> bool:
-        return any(obj.color == color for obj in self.rooms[room_index].objects)
-
+        return bool(self.room_color_mask[room_index] & (1 << COLOR_IDX[color]))
 
 class Condition:
-    """Base class for win conditions"""
-    def check(self, house: House) -> bool:
+    """Base class for win conditions.
+    
+    Subclasses implement compile(), which specializes the condition into a
+    closure over pre-resolved integer indices into House's counter arrays.
+    The closure is built once and reused by every check().
+    """
+    _compiled = None
+    # Number of full reports in which this condition was unmet; used to
+    # check the most-often-failing conditions first
+    _fail_count = 0
+    
+    def compile(self) -> Callable[[House], bool]:
+        raise NotImplementedError
+    
+    def table_row(self) -> tuple:
+        """(opcode, arg0, arg1) row for the batch condition table"""
         raise NotImplementedError
     
+    def predicate(self) -> Callable[[House], bool]:
+        if self._compiled is None:
+            self._compiled = self.compile()
+        return self._compiled
+    
+    def check(self, house: House) -> bool:
+        return self.predicate()(house)
+    
     def __str__(self):
         raise NotImplementedError
 
@@ -125,8 +234,12 @@ class MinObjectsOfColor(Condition):
         self.color = color
         self.min_count = min_count
     
-    def check(self, house: House) -> bool:
-        return house.count_objects_by_color(self.color) >= self.min_count
+    def compile(self) -> Callable[[House], bool]:
+        ci, n = COLOR_IDX[self.color], self.min_count
+        return lambda h: h.color_counts[ci] >= n
+    
+    def table_row(self) -> tuple:
+        return (OP_MIN_COLOR, COLOR_IDX[self.color], self.min_count)
     
     def __str__(self):
         return f"At least {self.min_count} {self.color} object(s) in the house"
@@ -136,8 +249,12 @@ class MaxObjectsOfColor(Condition):
         self.color = color
         self.max_count = max_count
     
-    def check(self, house: House) -> bool:
-        return house.count_objects_by_color(self.color) <= self.max_count
+    def compile(self) -> Callable[[House], bool]:
+        ci, n = COLOR_IDX[self.color], self.max_count
+        return lambda h: h.color_counts[ci] <= n
+    
+    def table_row(self) -> tuple:
+        return (OP_MAX_COLOR, COLOR_IDX[self.color], self.max_count)
     
     def __str__(self):
         return f"At most {self.max_count} {self.color} object(s) in the house"
@@ -147,8 +264,12 @@ class MinObjectsOfType(Condition):
         self.obj_type = obj_type
         self.min_count = min_count
     
-    def check(self, house: House) -> bool:
-        return house.count_objects_by_type(self.obj_type) >= self.min_count
+    def compile(self) -> Callable[[House], bool]:
+        ti, n = TYPE_IDX[self.obj_type], self.min_count
+        return lambda h: h.type_counts[ti] >= n
+    
+    def table_row(self) -> tuple:
+        return (OP_MIN_TYPE, TYPE_IDX[self.obj_type], self.min_count)
     
     def __str__(self):
         return f"At least {self.min_count} {self.obj_type}(s) in the house"
@@ -159,8 +280,12 @@ class RoomMustHaveType(Condition):
         self.room_name = room_name
         self.obj_type = obj_type
     
-    def check(self, house: House) -> bool:
-        return house.room_has_object_type(self.room_index, self.obj_type)
+    def compile(self) -> Callable[[House], bool]:
+        r, bit = self.room_index, 1 << TYPE_IDX[self.obj_type]
+        return lambda h: (h.room_type_mask[r] & bit) != 0
+    
+    def table_row(self) -> tuple:
+        return (OP_ROOM_HAS_TYPE, self.room_index, TYPE_IDX[self.obj_type])
     
     def __str__(self):
         return f"The {self.room_name} must have a {self.obj_type}"
@@ -171,8 +296,12 @@ class RoomMustHaveColor(Condition):
         self.room_name = room_name
         self.color = color
     
-    def check(self, house: House) -> bool:
-        return house.room_has_color(self.room_index, self.color)
+    def compile(self) -> Callable[[House], bool]:
+        r, bit = self.room_index, 1 << COLOR_IDX[self.color]
+        return lambda h: (h.room_color_mask[r] & bit) != 0
+    
+    def table_row(self) -> tuple:
+        return (OP_ROOM_HAS_COLOR, self.room_index, COLOR_IDX[self.color])
     
     def __str__(self):
         return f"The {self.room_name} must have a {self.color} object"
@@ -183,8 +312,12 @@ class RoomMustNotHaveColor(Condition):
         self.room_name = room_name
         self.color = color
     
-    def check(self, house: House) -> bool:
-        return not house.room_has_color(self.room_index, self.color)
+    def compile(self) -> Callable[[House], bool]:
+        r, bit = self.room_index, 1 << COLOR_IDX[self.color]
+        return lambda h: (h.room_color_mask[r] & bit) == 0
+    
+    def table_row(self) -> tuple:
+        return (OP_ROOM_NOT_COLOR, self.room_index, COLOR_IDX[self.color])
     
     def __str__(self):
         return f"The {self.room_name} must NOT have any {self.color} objects"
@@ -195,8 +328,12 @@ class RoomMinObjects(Condition):
         self.room_name = room_name
         self.min_count = min_count
     
-    def check(self, house: House) -> bool:
-        return house.count_objects_in_room(self.room_index) >= self.min_count
+    def compile(self) -> Callable[[House], bool]:
+        r, n = self.room_index, self.min_count
+        return lambda h: h.room_len[r] >= n
+    
+    def table_row(self) -> tuple:
+        return (OP_ROOM_MIN, self.room_index, self.min_count)
     
     def __str__(self):
         return f"The {self.room_name} must have at least {self.min_count} object(s)"
@@ -207,8 +344,12 @@ class RoomMaxObjects(Condition):
         self.room_name = room_name
         self.max_count = max_count
     
-    def check(self, house: House) -> bool:
-        return house.count_objects_in_room(self.room_index) <= self.max_count
+    def compile(self) -> Callable[[House], bool]:
+        r, n = self.room_index, self.max_count
+        return lambda h: h.room_len[r] <= n
+    
+    def table_row(self) -> tuple:
+        return (OP_ROOM_MAX, self.room_index, self.max_count)
     
     def __str__(self):
         return f"The {self.room_name} must have at most {self.max_count} object(s)"
@@ -218,6 +359,9 @@ class Player:
     def __init__(self, name: str, conditions: list):
         self.name = name
         self.conditions = conditions
+        self._results = None
+        self._results_version = None
+        self.reorder_checks()
     
     def show_conditions(self):
         print(f"\n{self.name}'s SECRET Conditions:")
@@ -227,37 +371,125 @@ class Player:
         print("-" * 40)
     
     def check_conditions(self, house: House) -> tuple:
-        results = [(cond, cond.check(house)) for cond in self.conditions]
-        return results
+        # Reuse the last results until the house is mutated again
+        if self._results is None or self._results_version != (id(house), house.version):
+            self._results = [(cond, cond.predicate()(house)) for cond in self.conditions]
+            self._results_version = (id(house), house.version)
+        return self._results
+    
+    def reorder_checks(self):
+        """Order the verdict path so historically failing conditions run first"""
+        self._check_order = sorted(self.conditions, key=lambda c: -c._fail_count)
+    
+    def all_met(self, house: House) -> bool:
+        for cond in self._check_order:
+            if not cond.predicate()(house):
+                return False
+        return True
 
 
-def generate_conditions(house: House):
-    """Generate random conditions for two players"""
-    room_names = ["Bathroom", "Bedroom", "Living Room", "Kitchen"]
-    all_conditions = []
+def _check_all(color_counts, type_counts, room_len, room_color, room_type, cond_table) -> bool:
+    """Evaluate every row of a condition table against flat counter arrays.
+    
+    Written in the subset of Python that Numba can compile; when Numba is
+    not installed check_all_conditions() uses the compiled predicates instead.
+    """
+    for k in range(cond_table.shape[0]):
+        op = cond_table[k, 0]
+        a0 = cond_table[k, 1]
+        a1 = cond_table[k, 2]
+        if op == OP_MIN_COLOR:
+            ok = color_counts[a0] >= a1
+        elif op == OP_MAX_COLOR:
+            ok = color_counts[a0] <= a1
+        elif op == OP_MIN_TYPE:
+            ok = type_counts[a0] >= a1
+        elif op == OP_ROOM_HAS_TYPE:
+            ok = room_type[a0, a1] > 0
+        elif op == OP_ROOM_HAS_COLOR:
+            ok = room_color[a0, a1] > 0
+        elif op == OP_ROOM_NOT_COLOR:
+            ok = room_color[a0, a1] == 0
+        elif op == OP_ROOM_MIN:
+            ok = room_len[a0] >= a1
+        elif op == OP_ROOM_MAX:
+            ok = room_len[a0] <= a1
+        else:
+            ok = False
+        if not ok:
+            return False
+    return True
+
+if njit is not None:
+    _check_all_jit = njit(cache=True)(_check_all)
+
+
+def condition_table(conditions: list):
+    """Pack conditions into an (n, 3) int32 array of (opcode, arg0, arg1)"""
+    return np.array([c.table_row() for c in conditions], dtype=np.int32).reshape(-1, 3)
+
+
+def check_all_conditions(house: House, conditions: list, table=None) -> bool:
+    """Batch verdict for solver/rollout use.
     
-    # Generate a pool of possible conditions
-    for color in Color:
-        all_conditions.append(MinObjectsOfColor(color, random.randint(1, 3)))
-        all_conditions.append(MaxObjectsOfColor(color, random.randint(1, 2)))
+    Runs the Numba kernel when available (pass a prebuilt condition_table()
+    to skip re-packing), otherwise falls back to the compiled predicates.
+    """
+    if njit is None:
+        return all(cond.predicate()(house) for cond in conditions)
+    if table is None:
+        table = condition_table(conditions)
+    return _check_all_jit(
+        np.array(house.color_counts, dtype=np.int16),
+        np.array(house.type_counts, dtype=np.int16),
+        np.array(house.room_len, dtype=np.int16),
+        np.array(house.room_color_counts, dtype=np.int16),
+        np.array(house.room_type_counts, dtype=np.int16),
+        table,
+    )
+
+
+ROOM_NAMES = ("Bathroom", "Bedroom", "Living Room", "Kitchen")
+
+def _build_condition_pool() -> tuple:
+    """Build every condition the game can deal, once, with predicates compiled.
     
-    for obj_type in ObjectType:
-        all_conditions.append(MinObjectsOfType(obj_type, random.randint(1, 2)))
+    Each entry is one slot of the original per-game pool and holds all of its
+    parameter variants, e.g. MinObjectsOfColor(RED, k) for k in 1..3, so
+    dealing a slot and then a variant keeps the original odds.
+    """
+    pool = []
+    for color in COLORS:
+        pool.append(tuple(MinObjectsOfColor(color, k) for k in (1, 2, 3)))
+        pool.append(tuple(MaxObjectsOfColor(color, k) for k in (1, 2)))
     
-    for i, room_name in enumerate(room_names):
-        for obj_type in ObjectType:
-            all_conditions.append(RoomMustHaveType(i, room_name, obj_type))
-        for color in Color:
-            all_conditions.append(RoomMustHaveColor(i, room_name, color))
-            all_conditions.append(RoomMustNotHaveColor(i, room_name, color))
-        all_conditions.append(RoomMinObjects(i, room_name, random.randint(1, 2)))
-        all_conditions.append(RoomMaxObjects(i, room_name, random.randint(1, 2)))
+    for obj_type in OBJECT_TYPES:
+        pool.append(tuple(MinObjectsOfType(obj_type, k) for k in (1, 2)))
     
-    random.shuffle(all_conditions)
+    for i, room_name in enumerate(ROOM_NAMES):
+        for obj_type in OBJECT_TYPES:
+            pool.append((RoomMustHaveType(i, room_name, obj_type),))
+        for color in COLORS:
+            pool.append((RoomMustHaveColor(i, room_name, color),))
+            pool.append((RoomMustNotHaveColor(i, room_name, color),))
+        pool.append(tuple(RoomMinObjects(i, room_name, k) for k in (1, 2)))
+        pool.append(tuple(RoomMaxObjects(i, room_name, k) for k in (1, 2)))
+    
+    for variants in pool:
+        for cond in variants:
+            cond._compiled = cond.compile()
+    return tuple(pool)
+
+CONDITION_POOL = _build_condition_pool()
+
+
+def generate_conditions(house: House):
+    """Generate random conditions for two players"""
+    dealt = [random.choice(variants) for variants in random.sample(CONDITION_POOL, 6)]
     
     # Give 3 conditions to each player
-    player1_conditions = all_conditions[:3]
-    player2_conditions = all_conditions[3:6]
+    player1_conditions = dealt[:3]
+    player2_conditions = dealt[3:6]
     
     return player1_conditions, player2_conditions
 
@@ -265,10 +497,10 @@ def generate_conditions(house: House):
 def create_object_menu():
     """Create object selection menu"""
     print("\n  Object Types:")
-    for i, obj_type in enumerate(ObjectType, 1):
+    for i, obj_type in enumerate(OBJECT_TYPES, 1):
         print(f"    {i}. {obj_type}")
     print("\n  Colors:")
-    for i, color in enumerate(Color, 1):
+    for i, color in enumerate(COLORS, 1):
         print(f"    {i}. {color}")
 
 
@@ -281,13 +513,13 @@ def get_object_choice() -> Optional[GameObject]:
         if not (0 <= type_choice < 4):
             print("Invalid choice!")
             return None
-        obj_type = list(ObjectType)[type_choice]
+        obj_type = OBJECT_TYPES[type_choice]
         
         color_choice = int(input("  Choose color (1-4): ")) - 1
         if not (0 <= color_choice < 4):
             print("Invalid choice!")
             return None
-        color = list(Color)[color_choice]
+        color = COLORS[color_choice]
         
         return GameObject(obj_type, color)
     except ValueError:
@@ -319,7 +551,7 @@ def play_turn(house: House, player: Player):
             
             obj = get_object_choice()
             if obj:
-                if house.rooms[room_num].add_object(obj):
+                if house.add_object(room_num, obj):
                     print(f"Added {obj} to {house.rooms[room_num].name}")
                 else:
                     print("Room is full! (max 3 objects)")
@@ -336,11 +568,11 @@ def play_turn(house: House, player: Player):
                 return False
             
             print(f"Objects in {room.name}:")
-            for i, obj in enumerate(room.objects, 1):
+            for i, obj in enumerate(room.get_objects(), 1):
                 print(f"  {i}. {obj}")
             
             obj_num = int(input("Remove which object? ")) - 1
-            removed = room.remove_object(obj_num)
+            removed = house.remove_object(room_num, obj_num)
             if removed:
                 print(f"Removed {removed}")
             else:
@@ -353,12 +585,12 @@ def play_turn(house: House, player: Player):
                 return False
             
             print("Wall colors:")
-            for i, wc in enumerate(WallColor, 1):
+            for i, wc in enumerate(WALL_COLORS, 1):
                 print(f"  {i}. {wc}")
             
             color_choice = int(input("Choose wall color (1-5): ")) - 1
             if 0 <= color_choice < 5:
-                house.rooms[room_num].wall_color = list(WallColor)[color_choice]
+                house.set_wall_color(room_num, WALL_COLORS[color_choice])
                 print(f"Changed {house.rooms[room_num].name} walls to {house.rooms[room_num].wall_color}")
             else:
                 print("Invalid color!")
@@ -385,8 +617,13 @@ def play_turn(house: House, player: Player):
     return False
 
 
-def check_victory(house: House, player1: Player, player2: Player) -> bool:
-    """Check if all conditions are satisfied"""
+def check_victory_verdict(house: House, player1: Player, player2: Player) -> bool:
+    """Fast win check with no output; stops at the first unmet condition"""
+    return player1.all_met(house) and player2.all_met(house)
+
+
+def check_victory_report(house: House, player1: Player, player2: Player) -> bool:
+    """Check if all conditions are satisfied, printing every result"""
     print("\n" + "="*60)
     print("           CHECKING WIN CONDITIONS")
     print("="*60)
@@ -401,6 +638,8 @@ def check_victory(house: House, player1: Player, player2: Player) -> bool:
             print(f"  [{status}] {cond}")
             if not met:
                 all_met = False
+                cond._fail_count += 1
+        player.reorder_checks()
     
     print("\n" + "="*60)
     
@@ -457,7 +696,7 @@ def main():
         check_win = play_turn(house, current_player)
         
         if check_win:
-            if check_victory(house, player1, player2):
+            if check_victory_report(house, player1, player2):
                 print(f"\nGame completed in {turn_count} turns!")
                 break
             input("Press Enter to continue...")
@@ -470,12 +709,12 @@ def main():
         cont = input("\nPress Enter to continue (or 'q' to quit): ").strip().lower()
         if cont == 'q':
             print("\nThanks for playing!")
-            check_victory(house, player1, player2)
+            check_victory_report(house, player1, player2)
             break
     
     if turn_count >= max_turns:
         print(f"\nGame ended after {max_turns} turns!")
-        check_victory(house, player1, player2)
+        check_victory_report(house, player1, player2)
 
 
 if __name__ == "__main__":
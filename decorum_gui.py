@@ -6,13 +6,30 @@ Premium Edition with fancy graphics, animations, and effects
 
 import tkinter as tk
 from tkinter import messagebox, scrolledtext, ttk, filedialog
+from tkinter import font as tkfont
 import json
 import random
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional, List
+from typing import Iterator, Optional, List
 import re
 import math
+from contextlib import contextmanager
+
+try:
+    import numpy as np
+except ImportError:  # optional: only needed for batch evaluation
+    np = None
+
+try:
+    from numba import njit
+except ImportError:  # optional: JIT for count_conditions_met
+    njit = None
+
+try:
+    import orjson
+except ImportError:  # optional: faster scenario file parsing
+    orjson = None
 
 # ============== GAME DATA ==============
 
@@ -25,14 +42,12 @@ class Color(Enum):
     BLUE = ("Blue", "#6BCBFF", "#E8F6FF", "#2980B9")
     GREEN = ("Green", "#6BCB77", "#E8FFE8", "#27AE60")
     
-    @property
-    def name_str(self): return self.value[0]
-    @property
-    def hex_color(self): return self.value[1]
-    @property
-    def light_hex(self): return self.value[2]
-    @property
-    def dark_hex(self): return self.value[3]
+    # Plain attributes rather than properties: these are read on every redraw
+    def __init__(self, name_str, hex_color, light_hex, dark_hex):
+        self.name_str = name_str
+        self.hex_color = hex_color
+        self.light_hex = light_hex
+        self.dark_hex = dark_hex
 
 class Style(Enum):
     MODERN = ("Modern", "◆", "#9B59B6")
@@ -40,26 +55,42 @@ class Style(Enum):
     RETRO = ("Retro", "◈", "#1ABC9C")
     UNUSUAL = ("Unusual", "✦", "#E91E63")
     
-    @property
-    def name_str(self): return self.value[0]
-    @property
-    def symbol(self): return self.value[1]
-    @property
-    def color(self): return self.value[2]
+    def __init__(self, name_str, symbol, color):
+        self.name_str = name_str
+        self.symbol = symbol
+        self.color = color
 
 class ObjectType(Enum):
-    LAMP = ("Lamp", "💡", "#FFE066")
-    WALL_HANGING = ("Wall Hanging", "🖼️", "#A29BFE")
-    CURIO = ("Curio", "🏺", "#FFEAA7")
-    
-    @property
-    def name_str(self): return self.value[0]
-    @property
-    def emoji(self): return self.value[1]
-    @property
-    def bg_color(self): return self.value[2]
-
-@dataclass
+    LAMP = ("Lamp", "💡", "#FFE066", 0)
+    WALL_HANGING = ("Wall Hanging", "🖼️", "#A29BFE", 1)
+    CURIO = ("Curio", "🏺", "#FFEAA7", 2)
+    
+    def __init__(self, name_str, emoji, bg_color, slot_idx):
+        self.name_str = name_str
+        self.emoji = emoji
+        self.bg_color = bg_color
+        self.slot_idx = slot_idx  # index into Room.slots
+
+# Bit index of each member, used by the Room masks and House counters
+for _members in (Color, Style, ObjectType):
+    for _i, _member in enumerate(_members):
+        _member.bit = _i
+del _members, _i, _member
+ALL_STYLES_MASK = (1 << len(Style)) - 1
+
+_ALL_COLORS = tuple(Color)
+_ALL_STYLES = tuple(Style)
+_ALL_TYPES = tuple(ObjectType)
+# Top-to-bottom slot order on a room card
+_CARD_SLOT_TYPES = (ObjectType.WALL_HANGING, ObjectType.LAMP, ObjectType.CURIO)
+# Display names, e.g. for combobox values
+_COLOR_NAMES = tuple(c.name_str for c in _ALL_COLORS)
+_STYLE_NAMES = tuple(s.name_str for s in _ALL_STYLES)
+_TYPE_NAMES = tuple(t.name_str for t in _ALL_TYPES)
+# Starting wall color of each room, in ROOM_NAMES order
+ROOM_WALL_COLORS = (Color.RED, Color.YELLOW, Color.BLUE, Color.GREEN)
+
+@dataclass(slots=True)
 class GameObject:
     obj_type: ObjectType
     color: Color
@@ -68,187 +99,539 @@ class GameObject:
     def __str__(self):
         return f"{self.style.name_str} {self.color.name_str} {self.obj_type.name_str}"
 
-@dataclass 
+@dataclass(slots=True)
 class Room:
     name: str
     icon: str
     wall_color: Color
-    lamp: Optional[GameObject] = None
-    wall_hanging: Optional[GameObject] = None
-    curio: Optional[GameObject] = None
+    # One entry per ObjectType, indexed by slot_idx (lamp, wall hanging, curio)
+    slots: List[Optional[GameObject]] = field(default_factory=lambda: [None, None, None])
+    # Bitmasks of the colors/styles/types currently in the room, kept in
+    # sync by set_slot()
+    color_mask: int = field(default=0, init=False)
+    style_mask: int = field(default=0, init=False)
+    type_mask: int = field(default=0, init=False)
+    
+    def __post_init__(self):
+        self._update_masks()
+    
+    def _update_masks(self):
+        color_mask = style_mask = type_mask = 0
+        for obj in self.slots:
+            if obj is not None:
+                color_mask |= 1 << obj.color.bit
+                style_mask |= 1 << obj.style.bit
+                type_mask |= 1 << obj.obj_type.bit
+        self.color_mask, self.style_mask, self.type_mask = color_mask, style_mask, type_mask
     
     def get_slot(self, obj_type: ObjectType) -> Optional[GameObject]:
-        if obj_type == ObjectType.LAMP: return self.lamp
-        elif obj_type == ObjectType.WALL_HANGING: return self.wall_hanging
-        else: return self.curio
+        return self.slots[obj_type.slot_idx]
     
     def set_slot(self, obj_type: ObjectType, obj: Optional[GameObject]):
-        if obj_type == ObjectType.LAMP: self.lamp = obj
-        elif obj_type == ObjectType.WALL_HANGING: self.wall_hanging = obj
-        else: self.curio = obj
+        self.slots[obj_type.slot_idx] = obj
+        self._update_masks()
     
     def is_slot_empty(self, obj_type: ObjectType) -> bool:
-        return self.get_slot(obj_type) is None
+        return self.slots[obj_type.slot_idx] is None
     
     def get_all_objects(self) -> List[GameObject]:
-        return [o for o in [self.lamp, self.wall_hanging, self.curio] if o]
+        return [o for o in self.slots if o is not None]
+    
+    def iter_objects(self) -> Iterator[GameObject]:
+        """Like get_all_objects() without building a list, for loops that only scan"""
+        for o in self.slots:
+            if o is not None:
+                yield o
     
     def has_empty_slot(self) -> bool:
-        return self.lamp is None or self.wall_hanging is None or self.curio is None
+        return None in self.slots
 
 class House:
     def __init__(self):
-        self.rooms = [Room(ROOM_NAMES[i], ROOM_ICONS[i], list(Color)[i]) for i in range(4)]
+        self.rooms = [Room(ROOM_NAMES[i], ROOM_ICONS[i], ROOM_WALL_COLORS[i]) for i in range(4)]
+        # Counts kept in step with the rooms by place()/remove()/paint();
+        # mutate the house only through those so they never drift
+        # (lists indexed by the enum member's bit)
+        self._color_counts = [0] * len(Color)
+        self._style_counts = [0] * len(Style)
+        self._wall_counts = [0] * len(Color)
+        for room in self.rooms:
+            self._wall_counts[room.wall_color.bit] += 1
+        self._objs_cache = None  # flat object list, rebuilt lazily when None
+        self.track_conditions([])
+    
+    def track_conditions(self, conditions: List["Condition"]):
+        """Index conditions by what they depend on and evaluate them once.
+        
+        After this, place()/paint() re-check only the conditions a change can
+        affect and keep the results in self.satisfied.
+        """
+        self._conds_by_room = [[] for _ in self.rooms]
+        self._conds_by_color = {c: [] for c in Color}
+        self._conds_by_style = {s: [] for s in Style}
+        self._conds_by_type = {t: [] for t in ObjectType}
+        self._conds_by_any_object = []  # e.g. AllStylesPresent
+        for cond in conditions:
+            if cond.affected_room is not None:
+                self._conds_by_room[cond.affected_room].append(cond)
+            elif cond.affected_color is not None:
+                self._conds_by_color[cond.affected_color].append(cond)
+            elif cond.affected_style is not None:
+                self._conds_by_style[cond.affected_style].append(cond)
+            elif cond.affected_type is not None:
+                self._conds_by_type[cond.affected_type].append(cond)
+            else:
+                self._conds_by_any_object.append(cond)
+        self.satisfied = {cond: cond.check(self) for cond in conditions}
+    
+    def is_satisfied(self, cond: "Condition") -> bool:
+        met = self.satisfied.get(cond)
+        return cond.check(self) if met is None else met
+    
+    def _recheck(self, conds: List["Condition"]):
+        satisfied = self.satisfied
+        for cond in conds:
+            satisfied[cond] = cond.check(self)
+    
+    def place(self, room_idx: int, obj_type: ObjectType, obj: Optional[GameObject]) -> Optional[GameObject]:
+        """Put obj (or None) in a room slot and return the previous occupant"""
+        room = self.rooms[room_idx]
+        prev = room.get_slot(obj_type)
+        if prev is not None:
+            self._color_counts[prev.color.bit] -= 1
+            self._style_counts[prev.style.bit] -= 1
+        if obj is not None:
+            self._color_counts[obj.color.bit] += 1
+            self._style_counts[obj.style.bit] += 1
+        room.set_slot(obj_type, obj)
+        self._objs_cache = None
+        if self.satisfied:
+            self._recheck(self._conds_by_room[room_idx])
+            self._recheck(self._conds_by_type[obj_type])
+            self._recheck(self._conds_by_any_object)
+            for changed in (prev, obj):
+                if changed is not None:
+                    self._recheck(self._conds_by_color[changed.color])
+                    self._recheck(self._conds_by_style[changed.style])
+        return prev
+    
+    def remove(self, room_idx: int, obj_type: ObjectType) -> Optional[GameObject]:
+        return self.place(room_idx, obj_type, None)
+    
+    def paint(self, room_idx: int, color: Color) -> Color:
+        """Repaint a room's walls and return the previous color"""
+        room = self.rooms[room_idx]
+        prev = room.wall_color
+        self._wall_counts[prev.bit] -= 1
+        self._wall_counts[color.bit] += 1
+        room.wall_color = color
+        if self.satisfied:
+            self._recheck(self._conds_by_room[room_idx])
+        return prev
     
     def get_all_objects(self) -> List[GameObject]:
-        return [obj for room in self.rooms for obj in room.get_all_objects()]
+        if self._objs_cache is None:
+            self._objs_cache = [obj for room in self.rooms for obj in room.iter_objects()]
+        return self._objs_cache
     
     def count_by_color(self, color: Color) -> int:
-        return sum(1 for obj in self.get_all_objects() if obj.color == color)
+        return self._color_counts[color.bit]
     
     def count_by_style(self, style: Style) -> int:
-        return sum(1 for obj in self.get_all_objects() if obj.style == style)
+        return self._style_counts[style.bit]
     
     def count_walls_by_color(self, color: Color) -> int:
-        return sum(1 for room in self.rooms if room.wall_color == color)
+        return self._wall_counts[color.bit]
     
     def room_has_color(self, room_idx: int, color: Color) -> bool:
-        return any(obj.color == color for obj in self.rooms[room_idx].get_all_objects())
+        return bool((self.rooms[room_idx].color_mask >> color.bit) & 1)
     
     def room_has_style(self, room_idx: int, style: Style) -> bool:
-        return any(obj.style == style for obj in self.rooms[room_idx].get_all_objects())
+        return bool((self.rooms[room_idx].style_mask >> style.bit) & 1)
+    
+    def style_mask(self) -> int:
+        mask = 0
+        for room in self.rooms:
+            mask |= room.style_mask
+        return mask
+    
+    def to_array(self):
+        """(rooms, slots) int8 array: -1 for empty, else (color.bit << 4) | style.bit.
+        
+        Stack several of these along a leading axis to score many candidate
+        houses at once with the batch_* helpers. Requires NumPy.
+        """
+        if np is None:
+            raise RuntimeError("NumPy is required for batch evaluation")
+        state = np.full((len(self.rooms), len(ObjectType)), -1, dtype=np.int8)
+        for r, room in enumerate(self.rooms):
+            for obj in room.iter_objects():
+                state[r, obj.obj_type.slot_idx] = (obj.color.bit << 4) | obj.style.bit
+        return state
+    
+    def walls_to_array(self):
+        """(rooms,) int8 array of wall color bits, to go with to_array()"""
+        if np is None:
+            raise RuntimeError("NumPy is required for batch evaluation")
+        return np.array([room.wall_color.bit for room in self.rooms], dtype=np.int8)
+
+# ============== BATCH EVALUATION (NumPy) ==============
+# These take stacked House.to_array() states of shape (..., rooms, slots) and
+# return one result per state.
+
+def batch_count_by_color(states, color: Color):
+    return ((states >= 0) & ((states >> 4) == color.bit)).sum(axis=(-2, -1))
+
+def batch_count_by_style(states, style: Style):
+    return ((states >= 0) & ((states & 0xF) == style.bit)).sum(axis=(-2, -1))
+
+def batch_room_has_color(states, room_idx: int, color: Color):
+    room = states[..., room_idx, :]
+    return ((room >= 0) & ((room >> 4) == color.bit)).any(axis=-1)
+
+def batch_room_has_style(states, room_idx: int, style: Style):
+    room = states[..., room_idx, :]
+    return ((room >= 0) & ((room & 0xF) == style.bit)).any(axis=-1)
 
 # ============== CONDITIONS ==============
 
 class Condition:
+    # Subclasses list their own fields in __slots__; the class attributes
+    # below are the defaults they don't override
+    __slots__ = ()
+    # Conditions are immutable, so subclasses render their text once into _str
+    _str = ""
+    # What a condition depends on, used by House.track_conditions to re-check
+    # only the conditions a move can affect. Room-scoped conditions set only
+    # affected_room; a condition with none set is re-checked on every move.
+    affected_room: Optional[int] = None
+    affected_color: Optional[Color] = None
+    affected_style: Optional[Style] = None
+    affected_type: Optional[ObjectType] = None
     def check(self, house: House) -> bool: raise NotImplementedError
-    def __str__(self): raise NotImplementedError
+    def table_row(self) -> tuple:
+        """(kind, arg0, arg1) row for condition_table()"""
+        raise NotImplementedError
+    def __str__(self): return self._str
 
 class MinObjectsOfColor(Condition):
+    __slots__ = ("color", "count", "_str", "affected_color")
     def __init__(self, color: Color, count: int):
         self.color, self.count = color, count
+        self._str = f"At least {self.count} {self.color.name_str} object(s)"
+        self.affected_color = color
     def check(self, house: House) -> bool:
         return house.count_by_color(self.color) >= self.count
-    def __str__(self):
-        return f"At least {self.count} {self.color.name_str} object(s)"
+    def table_row(self) -> tuple:
+        return (KIND_MIN_COLOR, self.color.bit, self.count)
 
 class MaxObjectsOfColor(Condition):
+    __slots__ = ("color", "count", "_str", "affected_color")
     def __init__(self, color: Color, count: int):
         self.color, self.count = color, count
+        self._str = f"At most {self.count} {self.color.name_str} object(s)"
+        self.affected_color = color
     def check(self, house: House) -> bool:
         return house.count_by_color(self.color) <= self.count
-    def __str__(self):
-        return f"At most {self.count} {self.color.name_str} object(s)"
+    def table_row(self) -> tuple:
+        return (KIND_MAX_COLOR, self.color.bit, self.count)
 
 class NoObjectsOfColor(Condition):
+    __slots__ = ("color", "_str", "affected_color")
     def __init__(self, color: Color):
         self.color = color
+        self._str = f"No {self.color.name_str} objects in house"
+        self.affected_color = color
     def check(self, house: House) -> bool:
         return house.count_by_color(self.color) == 0
-    def __str__(self):
-        return f"No {self.color.name_str} objects in house"
+    def table_row(self) -> tuple:
+        return (KIND_NO_COLOR, self.color.bit, 0)
 
 class MinObjectsOfStyle(Condition):
+    __slots__ = ("style", "count", "_str", "affected_style")
     def __init__(self, style: Style, count: int):
         self.style, self.count = style, count
+        self._str = f"At least {self.count} {self.style.name_str} object(s)"
+        self.affected_style = style
     def check(self, house: House) -> bool:
         return house.count_by_style(self.style) >= self.count
-    def __str__(self):
-        return f"At least {self.count} {self.style.name_str} object(s)"
+    def table_row(self) -> tuple:
+        return (KIND_MIN_STYLE, self.style.bit, self.count)
 
 class AllStylesPresent(Condition):
+    __slots__ = ()
+    _str = "All 4 styles must be present"
     def check(self, house: House) -> bool:
-        return all(house.count_by_style(s) > 0 for s in Style)
-    def __str__(self):
-        return "All 4 styles must be present"
+        seen = 0
+        for room in house.rooms:
+            seen |= room.style_mask
+            if seen == ALL_STYLES_MASK:
+                return True
+        return False
+    def table_row(self) -> tuple:
+        return (KIND_ALL_STYLES, 0, 0)
 
 class RoomHasColor(Condition):
+    __slots__ = ("room_idx", "room_name", "color", "_str", "affected_room")
     def __init__(self, room_idx: int, room_name: str, color: Color):
         self.room_idx, self.room_name, self.color = room_idx, room_name, color
+        self._str = f"{self.room_name}: needs {self.color.name_str} object"
+        self.affected_room = room_idx
     def check(self, house: House) -> bool:
         return house.room_has_color(self.room_idx, self.color)
-    def __str__(self):
-        return f"{self.room_name}: needs {self.color.name_str} object"
+    def table_row(self) -> tuple:
+        return (KIND_ROOM_COLOR, self.room_idx, self.color.bit)
 
 class RoomHasStyle(Condition):
+    __slots__ = ("room_idx", "room_name", "style", "_str", "affected_room")
     def __init__(self, room_idx: int, room_name: str, style: Style):
         self.room_idx, self.room_name, self.style = room_idx, room_name, style
+        self._str = f"{self.room_name}: needs {self.style.name_str} object"
+        self.affected_room = room_idx
     def check(self, house: House) -> bool:
         return house.room_has_style(self.room_idx, self.style)
-    def __str__(self):
-        return f"{self.room_name}: needs {self.style.name_str} object"
+    def table_row(self) -> tuple:
+        return (KIND_ROOM_STYLE, self.room_idx, self.style.bit)
 
 class RoomHasObjectType(Condition):
+    __slots__ = ("room_idx", "room_name", "obj_type", "_str", "affected_room")
     def __init__(self, room_idx: int, room_name: str, obj_type: ObjectType):
         self.room_idx, self.room_name, self.obj_type = room_idx, room_name, obj_type
+        self._str = f"{self.room_name}: needs a {self.obj_type.name_str}"
+        self.affected_room = room_idx
     def check(self, house: House) -> bool:
         return house.rooms[self.room_idx].get_slot(self.obj_type) is not None
-    def __str__(self):
-        return f"{self.room_name}: needs a {self.obj_type.name_str}"
+    def table_row(self) -> tuple:
+        return (KIND_ROOM_TYPE, self.room_idx, self.obj_type.slot_idx)
 
 class RoomWallColor(Condition):
+    __slots__ = ("room_idx", "room_name", "color", "_str", "affected_room")
     def __init__(self, room_idx: int, room_name: str, color: Color):
         self.room_idx, self.room_name, self.color = room_idx, room_name, color
+        self._str = f"{self.room_name}: walls must be {self.color.name_str}"
+        self.affected_room = room_idx
     def check(self, house: House) -> bool:
-        return house.rooms[self.room_idx].wall_color == self.color
-    def __str__(self):
-        return f"{self.room_name}: walls must be {self.color.name_str}"
+        return house.rooms[self.room_idx].wall_color is self.color
+    def table_row(self) -> tuple:
+        return (KIND_ROOM_WALL, self.room_idx, self.color.bit)
 
 class EveryRoomHasType(Condition):
+    __slots__ = ("obj_type", "_str", "affected_type")
     def __init__(self, obj_type: ObjectType):
         self.obj_type = obj_type
+        self._str = f"Every room needs a {self.obj_type.name_str}"
+        self.affected_type = obj_type
     def check(self, house: House) -> bool:
         return all(room.get_slot(self.obj_type) is not None for room in house.rooms)
-    def __str__(self):
-        return f"Every room needs a {self.obj_type.name_str}"
+    def table_row(self) -> tuple:
+        return (KIND_EVERY_TYPE, self.obj_type.slot_idx, 0)
+
+# ============== FAST EVALUATION (Numba) ==============
+# Conditions packed as (kind, arg0, arg1) rows, evaluated against the
+# House.to_array()/walls_to_array() encoding. Colors and styles are given by
+# .bit, object types by .slot_idx.
+
+KIND_MIN_COLOR = 0
+KIND_MAX_COLOR = 1
+KIND_NO_COLOR = 2
+KIND_MIN_STYLE = 3
+KIND_ALL_STYLES = 4
+KIND_ROOM_COLOR = 5
+KIND_ROOM_STYLE = 6
+KIND_ROOM_TYPE = 7
+KIND_ROOM_WALL = 8
+KIND_EVERY_TYPE = 9
+
+def _eval_conditions(state, walls, cond_table) -> int:
+    """Count the rows of cond_table that hold for one packed house.
+    
+    Written in the subset of Python that Numba can compile; without Numba
+    count_conditions_met() uses Condition.check instead.
+    """
+    n_rooms, n_slots = state.shape
+    color_counts = np.zeros(4, np.int32)
+    style_counts = np.zeros(4, np.int32)
+    room_colors = np.zeros(n_rooms, np.int32)  # presence masks by .bit
+    room_styles = np.zeros(n_rooms, np.int32)
+    for r in range(n_rooms):
+        for s in range(n_slots):
+            v = state[r, s]
+            if v >= 0:
+                c = v >> 4
+                st = v & 0xF
+                color_counts[c] += 1
+                style_counts[st] += 1
+                room_colors[r] |= 1 << c
+                room_styles[r] |= 1 << st
+    met = 0
+    for k in range(cond_table.shape[0]):
+        kind = cond_table[k, 0]
+        a0 = cond_table[k, 1]
+        a1 = cond_table[k, 2]
+        if kind == KIND_MIN_COLOR:
+            ok = color_counts[a0] >= a1
+        elif kind == KIND_MAX_COLOR:
+            ok = color_counts[a0] <= a1
+        elif kind == KIND_NO_COLOR:
+            ok = color_counts[a0] == 0
+        elif kind == KIND_MIN_STYLE:
+            ok = style_counts[a0] >= a1
+        elif kind == KIND_ALL_STYLES:
+            ok = True
+            for st in range(4):
+                if style_counts[st] == 0:
+                    ok = False
+        elif kind == KIND_ROOM_COLOR:
+            ok = (room_colors[a0] >> a1) & 1 == 1
+        elif kind == KIND_ROOM_STYLE:
+            ok = (room_styles[a0] >> a1) & 1 == 1
+        elif kind == KIND_ROOM_TYPE:
+            ok = state[a0, a1] >= 0
+        elif kind == KIND_ROOM_WALL:
+            ok = walls[a0] == a1
+        elif kind == KIND_EVERY_TYPE:
+            ok = True
+            for r in range(n_rooms):
+                if state[r, a0] < 0:
+                    ok = False
+        else:
+            ok = False
+        if ok:
+            met += 1
+    return met
+
+def _eval_conditions_many(states, walls, cond_table):
+    """_eval_conditions over a stack of packed houses, compiled as one loop"""
+    met = np.zeros(states.shape[0], np.int32)
+    for i in range(states.shape[0]):
+        met[i] = _eval_conditions_jit(states[i], walls[i], cond_table)
+    return met
+
+if njit is not None and np is not None:
+    _eval_conditions_jit = njit(cache=True)(_eval_conditions)
+    _eval_conditions_many_jit = njit(cache=True)(_eval_conditions_many)
+else:
+    _eval_conditions_jit = None
+    _eval_conditions_many_jit = None
+
+def condition_table(conditions: List[Condition]):
+    """Pack conditions into an (n, 3) int8 array of (kind, arg0, arg1)"""
+    if np is None:
+        raise RuntimeError("NumPy is required for batch evaluation")
+    return np.array([c.table_row() for c in conditions], dtype=np.int8).reshape(-1, 3)
+
+def count_conditions_met(house: House, conditions: List[Condition], table=None) -> int:
+    """Number of conditions met, for scoring many candidate moves.
+    
+    Runs the Numba kernel when available (pass a prebuilt condition_table()
+    to skip re-packing), otherwise falls back to Condition.check.
+    """
+    if _eval_conditions_jit is None:
+        return [c.check(house) for c in conditions].count(True)
+    if table is None:
+        table = condition_table(conditions)
+    return _eval_conditions_jit(house.to_array(), house.walls_to_array(), table)
+
+def batch_count_conditions_met(states, walls, table):
+    """count_conditions_met for stacked to_array() / walls_to_array() results.
+    
+    Scores every candidate house in one Numba call; without Numba the kernel
+    runs as plain Python per house. Requires NumPy.
+    """
+    if _eval_conditions_many_jit is not None:
+        return _eval_conditions_many_jit(states, walls, table)
+    if np is None:
+        raise RuntimeError("NumPy is required for batch evaluation")
+    return np.array([_eval_conditions(s, w, table) for s, w in zip(states, walls)],
+                    dtype=np.int32)
+
+# Conditions without a random parameter are immutable, so they are built once
+# and shared between games
+_ROOM_COLOR_CONDS = tuple(RoomHasColor(i, room_name, color)
+                          for i, room_name in enumerate(ROOM_NAMES) for color in _ALL_COLORS)
+_ROOM_WALL_CONDS = tuple(RoomWallColor(i, room_name, color)
+                         for i, room_name in enumerate(ROOM_NAMES) for color in _ALL_COLORS)
+_ROOM_TYPE_CONDS = tuple(RoomHasObjectType(i, room_name, obj_type)
+                         for i, room_name in enumerate(ROOM_NAMES) for obj_type in _ALL_TYPES)
+_FIXED_CONDS = _ROOM_COLOR_CONDS + _ROOM_WALL_CONDS + _ROOM_TYPE_CONDS
+# Count ranges for the parameterized conditions, drawn fresh on each deal
+_COLOR_RANGES = (1, 3)
+_STYLE_RANGES = (1, 2)
+
+def _pool_condition(idx: int) -> Condition:
+    """Pool index -> condition: colors, then styles, then the fixed conditions"""
+    if idx < len(_ALL_COLORS):
+        return MinObjectsOfColor(_ALL_COLORS[idx], random.randint(*_COLOR_RANGES))
+    idx -= len(_ALL_COLORS)
+    if idx < len(_ALL_STYLES):
+        return MinObjectsOfStyle(_ALL_STYLES[idx], random.randint(*_STYLE_RANGES))
+    return _FIXED_CONDS[idx - len(_ALL_STYLES)]
 
 def generate_random_conditions(count_per_player: int = 3):
-    all_conditions = []
-    for color in Color:
-        all_conditions.append(MinObjectsOfColor(color, random.randint(1, 3)))
-    for style in Style:
-        all_conditions.append(MinObjectsOfStyle(style, random.randint(1, 2)))
-    for i, room_name in enumerate(ROOM_NAMES):
-        for color in Color:
-            all_conditions.append(RoomHasColor(i, room_name, color))
-            all_conditions.append(RoomWallColor(i, room_name, color))
-        for obj_type in ObjectType:
-            all_conditions.append(RoomHasObjectType(i, room_name, obj_type))
-    random.shuffle(all_conditions)
-    return all_conditions[:count_per_player], all_conditions[count_per_player:count_per_player*2]
+    pool_size = len(_ALL_COLORS) + len(_ALL_STYLES) + len(_FIXED_CONDS)
+    picks = [_pool_condition(i) for i in random.sample(range(pool_size), 2 * count_per_player)]
+    return picks[:count_per_player], picks[count_per_player:]
+
+# Lookup tables and patterns for parse_condition_text, built once
+_RE_AT_LEAST = re.compile(r"at least (\d+) (\w+) object")
+_RE_NO = re.compile(r"no (\w+) objects? in house")
+ROOM_MAP = {name.lower(): i for i, name in enumerate(ROOM_NAMES)}
+COLORS_LC = {c.name_str.lower(): c for c in Color}
+STYLES_LC = {s.name_str.lower(): s for s in Style}
+TYPES_LC = {t.name_str.lower(): t for t in ObjectType}
+
+# Case-insensitive enum lookups for scenario files, which may use either the
+# member name ("WALL_HANGING") or the display name ("Wall Hanging")
+TYPE_LOOKUP = {**TYPES_LC, **{t.name.lower(): t for t in ObjectType}}
+COLOR_LOOKUP = {**COLORS_LC, **{c.name.lower(): c for c in Color}}
+STYLE_LOOKUP = {**STYLES_LC, **{s.name.lower(): s for s in Style}}
+
+# Display name -> member, for the custom-conditions dialog's comboboxes
+COLORS_BY_NAME = {c.name_str: c for c in _ALL_COLORS}
+STYLES_BY_NAME = {s.name_str: s for s in _ALL_STYLES}
+TYPES_BY_NAME = {t.name_str: t for t in _ALL_TYPES}
+
+def _alternation(names) -> str:
+    return "|".join(re.escape(name) for name in names)
+
+_RE_ROOM = re.compile(_alternation(ROOM_MAP))
+_RE_ROOM_COLOR = re.compile(rf"must have a ({_alternation(COLORS_LC)}) object")
+_RE_ROOM_WALL = re.compile(rf"walls must be ({_alternation(COLORS_LC)})")
+_RE_ROOM_TYPE = re.compile(rf"must have a ({_alternation(TYPES_LC)})")
+_RE_EVERY = re.compile(rf"every room must have a ({_alternation(TYPES_LC)})")
+
+# Room-scoped forms, tried in order once a room name has been found
+_ROOM_FORMS = (
+    (_RE_ROOM_COLOR, lambda i, name: RoomHasColor(i, ROOM_NAMES[i], COLORS_LC[name])),
+    (_RE_ROOM_WALL, lambda i, name: RoomWallColor(i, ROOM_NAMES[i], COLORS_LC[name])),
+    (_RE_ROOM_TYPE, lambda i, name: RoomHasObjectType(i, ROOM_NAMES[i], TYPES_LC[name])),
+)
 
 def parse_condition_text(text: str) -> Optional[Condition]:
     text = text.strip().lower()
-    room_map = {name.lower(): i for i, name in enumerate(ROOM_NAMES)}
-    colors = {c.name_str.lower(): c for c in Color}
-    styles = {s.name_str.lower(): s for s in Style}
-    types = {t.name_str.lower(): t for t in ObjectType}
-    types["wall hanging"] = ObjectType.WALL_HANGING
+    colors, styles, types = COLORS_LC, STYLES_LC, TYPES_LC
     
-    m = re.search(r"at least (\d+) (\w+) object", text)
+    m = _RE_AT_LEAST.search(text)
     if m:
         count, what = int(m.group(1)), m.group(2)
         if what in colors: return MinObjectsOfColor(colors[what], count)
         if what in styles: return MinObjectsOfStyle(styles[what], count)
     
-    m = re.search(r"no (\w+) objects? in house", text)
+    m = _RE_NO.search(text)
     if m and m.group(1) in colors:
         return NoObjectsOfColor(colors[m.group(1)])
     
-    for room_name, room_idx in room_map.items():
-        if room_name in text:
-            for color_name, color in colors.items():
-                if f"must have a {color_name} object" in text:
-                    return RoomHasColor(room_idx, ROOM_NAMES[room_idx], color)
-                if f"walls must be {color_name}" in text:
-                    return RoomWallColor(room_idx, ROOM_NAMES[room_idx], color)
-            for type_name, obj_type in types.items():
-                if f"must have a {type_name}" in text:
-                    return RoomHasObjectType(room_idx, ROOM_NAMES[room_idx], obj_type)
-    
-    for type_name, obj_type in types.items():
-        if f"every room must have a {type_name}" in text:
-            return EveryRoomHasType(obj_type)
+    m = _RE_ROOM.search(text)
+    if m:
+        room_idx = ROOM_MAP[m.group(0)]
+        for pattern, build in _ROOM_FORMS:
+            form = pattern.search(text)
+            if form:
+                return build(room_idx, form.group(1))
+    
+    m = _RE_EVERY.search(text)
+    if m:
+        return EveryRoomHasType(types[m.group(1)])
     
     return None
 
@@ -274,10 +657,16 @@ VALID_OBJECTS_MAP = {
     },
 }
 
+VALID_TRIPLES = frozenset(
+    (obj_type, style, color)
+    for obj_type, by_style in VALID_OBJECTS_MAP.items()
+    for style, color in by_style.items()
+)
+
 def is_valid_object(obj_type: ObjectType, color: Color, style: Style) -> bool:
-    return VALID_OBJECTS_MAP.get(obj_type, {}).get(style) == color
+    return (obj_type, style, color) in VALID_TRIPLES
 
-def contrast_text_color(hex_color: str) -> str:
+def _contrast_text_color(hex_color: str) -> str:
     hex_color = hex_color.lstrip("#")
     r = int(hex_color[0:2], 16)
     g = int(hex_color[2:4], 16)
@@ -285,14 +674,82 @@ def contrast_text_color(hex_color: str) -> str:
     luminance = (0.299 * r) + (0.587 * g) + (0.114 * b)
     return "#2B2B2B" if luminance > 160 else "#FFFFFF"
 
+# The GUI only ever asks about a handful of colors, so answers are memoized;
+# the object palette is filled in up front
+_CONTRAST_CACHE = {hex_color: _contrast_text_color(hex_color)
+                   for c in Color for hex_color in (c.hex_color, c.light_hex, c.dark_hex)}
+
+def _blend(c1: str, c2: str, t: float) -> str:
+    """Mix two "#rrggbb" colors; t=0 gives c1 and t=1 gives c2"""
+    a = int(c1[1:], 16)
+    b = int(c2[1:], 16)
+    channels = ((a >> s & 255) * (1 - t) + (b >> s & 255) * t for s in (16, 8, 0))
+    return "#" + "".join(f"{round(c):02x}" for c in channels)
+
+def contrast_text_color(hex_color: str) -> str:
+    fg = _CONTRAST_CACHE.get(hex_color)
+    if fg is None:
+        fg = _CONTRAST_CACHE[hex_color] = _contrast_text_color(hex_color)
+    return fg
+
 ALL_OBJECTS = [
     GameObject(obj_type, VALID_OBJECTS_MAP[obj_type][style], style)
     for obj_type in ObjectType
     for style in Style
 ]
 
+# The object picker's choices, one per style; objects are never mutated, so
+# placing one of these shares it
+OBJECTS_BY_TYPE = {
+    obj_type: [obj for obj in ALL_OBJECTS if obj.obj_type is obj_type]
+    for obj_type in ObjectType
+}
+
+# Label text that depends only on colors and styles, formatted once here
+# rather than on every card refresh
+_WALL_CHIP_TEXT = {c: f"● {c.name_str}" for c in Color}
+_WALL_SEL_TEXT = {c: f"🎨{c.name_str}" for c in Color}
+_SLOT_META_TEXT = {(s, c): f"{s.name_str} • {c.name_str}" for s in Style for c in Color}
+
+# check_win's summary: (has conditions, all met) -> (icon, THEME color, text)
+_WIN_STATUS = {
+    (False, False): ("📋", 'warning', "No conditions set for current player."),
+    (True, True): ("✅", 'success', "All your conditions are met!"),
+    (True, False): ("⏳", 'warning', "{met}/{total} conditions met"),
+}
+
+# show_game_over's header: all met -> (icon, banner, THEME color, text, text style)
+_GAME_OVER_STATUS = {
+    True: ("🎉🏆🎉", "VICTORY!", 'accent_gold', "You completed all conditions!",
+           "Won.Dialog.TLabel"),
+    False: ("⏰", "Time's Up!", 'error', "You ran out of turns before completing all conditions.",
+            "Dialog.TLabel"),
+}
+
+# show_fancy_message's icon and THEME color for each message type
+_MESSAGE_ICONS = {"info": "ℹ️", "warning": "⚠️", "error": "❌", "success": "✅"}
+_MESSAGE_COLORS = {"info": 'accent_lavender', "warning": 'warning', "error": 'error',
+                   "success": 'success'}
+
+# ttk styles for the room card headers, one per wall color; see _init_styles
+_ROOM_TITLE_STYLE = {c: f"{c.name}.RoomTitle.TLabel" for c in Color}
+_ROOM_WALL_STYLE = {c: f"{c.name}.RoomWall.TLabel" for c in Color}
+
 # ============== PREMIUM GUI ==============
 
+def _hover_enter(event):
+    event.widget.configure(bg=event.widget.hover_color)
+
+def _hover_leave(event):
+    event.widget.configure(bg=event.widget.bg_color)
+
+def bind_hover(widget, bg_color, hover_color):
+    """Show hover_color while the pointer is over widget, bg_color otherwise"""
+    widget.bg_color = bg_color
+    widget.hover_color = hover_color
+    widget.bind("<Enter>", _hover_enter)
+    widget.bind("<Leave>", _hover_leave)
+
 class StyledButton(tk.Button):
     """Styled button with hover effects"""
     def __init__(self, parent, text="", command=None, bg_color="#6C5CE7", 
@@ -304,11 +761,13 @@ class StyledButton(tk.Button):
                         activebackground=hover_color, activeforeground=fg_color,
                         cursor="hand2", command=command, padx=padx, pady=pady, **kwargs)
         
+        bind_hover(self, bg_color, hover_color)
+    
+    def restyle(self, text, bg_color, hover_color):
+        """Change the label and colors in place, keeping the hover effect"""
         self.bg_color = bg_color
         self.hover_color = hover_color
-        
-        self.bind("<Enter>", lambda e: self.configure(bg=self.hover_color))
-        self.bind("<Leave>", lambda e: self.configure(bg=self.bg_color))
+        self.configure(text=text, bg=bg_color, activebackground=hover_color)
 
 
 class DecorumGame:
@@ -316,6 +775,7 @@ class DecorumGame:
         self.root = root
         self.root.title("✨ DECORUM ✨")
         self.root.geometry("1500x950")
+        self._screen_size = (self.root.winfo_screenwidth(), self.root.winfo_screenheight())
         self.root.configure(bg="#FAF3E8")
         self.root.resizable(True, True)
         
@@ -323,6 +783,7 @@ class DecorumGame:
         self.current_player = 0
         self.player_names = ["Player 1", "Player 2"]
         self.player_conditions = [[], []]
+        self._all_conditions = []  # both players' conditions, set when they are revealed
         self.selected_room = None
         self.selected_slot = None
         self.turn_count = 0
@@ -333,11 +794,17 @@ class DecorumGame:
         self.action_taken_this_turn = False  # Track if player took action
         self.waiting_for_reaction = False    # Track if waiting for partner reaction
         self.last_action = None              # Track last action for undo
-        self.room_borders = {}
-        self.room_glows = {}
-        self.slot_containers = {}
-        self.selection_labels = {}
+        self.room_cards = []                 # per-room widget handles, see create_room_card
+        self._shown_selected_room = None     # selection the room cards last drew
         self.reaction_label = None
+        self._tooltip_win = None             # shared hover tooltip, see bind_tooltip
+        self._tooltip_lbl = None
+        self._tooltip_texts = {}             # widget path -> text function, see bind_tooltip
+        self._dialogs = {}                   # hidden reusable dialogs, see _dialog
+        self._turn_overlay = None            # end-of-turn banner, see _show_turn_overlay
+        self._redraw_pending = False         # an update_game_ui() is queued, see request_redraw
+        self._batch_depth = 0                # open batched_updates() blocks
+        self._redraw_deferred = False        # request_redraw() called inside one of them
         
         # Pastel color palette (inspired by Decorum game)
         self.THEME = {
@@ -372,66 +839,129 @@ class DecorumGame:
             {'bg': '#FFF3E0', 'accent': '#FFCC80', 'name': 'Peach'},     # Bathroom
         ]
         
+        self._init_styles()
+        self.root.bind_class("Tooltip", "<Enter>", self._on_tooltip_enter)
+        self.root.bind_class("Tooltip", "<Leave>", self._on_tooltip_leave)
         self.show_splash_screen()
+    
+    def _init_styles(self):
+        """Named ttk styles and fonts shared by the widgets the game UI makes"""
+        self._fonts = {}
+        T = self.THEME
+        style = ttk.Style(self.root)
+        style.configure("RoomTitle.TLabel", font=("Georgia", 11, "bold"), foreground="white")
+        style.configure("RoomWall.TLabel", font=("Segoe UI", 9, "bold"), foreground="white")
+        for c in _ALL_COLORS:
+            style.configure(_ROOM_TITLE_STYLE[c], background=c.dark_hex)
+            style.configure(_ROOM_WALL_STYLE[c], background=c.dark_hex)
+        style.configure("SlotType.TLabel", font=("Segoe UI", 9, "bold"), background='#FFFFFF',
+                        foreground=T['text_dark'], anchor='w', justify='left')
+        style.configure("SlotMeta.TLabel", font=("Segoe UI", 8), background='#FFFFFF',
+                        foreground=T['text_medium'], anchor='e', justify='right')
+        style.configure("Empty.SlotMeta.TLabel", foreground='#AFA8A0')
+        self._dialog_styles_ready = False
+    
+    def _init_dialog_styles(self):
+        """Styles for the heart-to-heart and game-over text, set up on first use"""
+        if self._dialog_styles_ready:
+            return
+        self._dialog_styles_ready = True
+        T = self.THEME
+        style = ttk.Style(self.root)
+        # The dotted variants inherit Dialog.TLabel's background
+        style.configure("Dialog.TLabel", background=T['bg'], foreground=T['text_medium'],
+                        font=self._font("Segoe UI", 12))
+        style.configure("Icon.Dialog.TLabel", font=self._font("Segoe UI", 56))
+        style.configure("Title.Dialog.TLabel", font=self._font("Georgia", 22, "bold"),
+                        foreground=T['text_dark'])
+        style.configure("Banner.Dialog.TLabel", font=self._font("Georgia", 32, "bold"))
+        style.configure("Won.Dialog.TLabel", font=self._font("Segoe UI", 14),
+                        foreground=T['text_dark'])
+        style.configure("Note.Dialog.TLabel", background=T['bg_alt'], foreground=T['text_dark'],
+                        justify='center')
+    
+    def _font(self, family, size, weight="normal"):
+        """A named font shared by every widget asking for the same one.
+        
+        Tk drops a font once no widget uses it, so dialogs built per open
+        would reload theirs each time; these stay loaded.
+        """
+        key = (family, size, weight)
+        font = self._fonts.get(key)
+        if font is None:
+            font = self._fonts[key] = tkfont.Font(self.root, family=family, size=size,
+                                                  weight=weight)
+        return font
 
     def bind_tooltip(self, widget, text_func):
-        """Simple tooltip on hover"""
-        def on_enter(event):
-            if not text_func():
-                return
-            tip = tk.Toplevel(self.root)
-            tip.overrideredirect(True)
-            tip.configure(bg="#333333")
-            x = event.x_root + 10
-            y = event.y_root + 10
-            tip.geometry(f"+{x}+{y}")
-            label = tk.Label(tip, text=text_func(), font=("Segoe UI", 9),
-                            bg="#333333", fg="white", padx=6, pady=4)
-            label.pack()
-            widget._tooltip = tip
-        def on_leave(event):
-            tip = getattr(widget, "_tooltip", None)
-            if tip:
-                tip.destroy()
-                widget._tooltip = None
-        widget.bind("<Enter>", on_enter)
-        widget.bind("<Leave>", on_leave)
+        """Simple tooltip on hover (one hidden window, shared by all widgets).
+        
+        The hover handlers are bound once on the "Tooltip" bindtag; each
+        widget just records the function giving its text.
+        """
+        self._tooltip_texts[str(widget)] = text_func
+        widget.bindtags(("Tooltip",) + widget.bindtags())
+    
+    def _on_tooltip_enter(self, event):
+        text_func = self._tooltip_texts.get(str(event.widget))
+        text = text_func() if text_func else None
+        if not text:
+            return
+        # build_game_ui() destroys every root child, the tooltip included
+        if self._tooltip_win is None or not self._tooltip_win.winfo_exists():
+            self._tooltip_win = tk.Toplevel(self.root)
+            self._tooltip_win.overrideredirect(True)
+            self._tooltip_win.configure(bg="#333333")
+            self._tooltip_lbl = tk.Label(self._tooltip_win, font=("Segoe UI", 9),
+                                         bg="#333333", fg="white", padx=6, pady=4)
+            self._tooltip_lbl.pack()
+        self._tooltip_lbl.configure(text=text)
+        x = event.x_root + 10
+        y = event.y_root + 10
+        self._tooltip_win.geometry(f"+{x}+{y}")
+        self._tooltip_win.deiconify()
+        self._tooltip_win.lift()
+    
+    def _on_tooltip_leave(self, event):
+        if self._tooltip_win is not None and self._tooltip_win.winfo_exists():
+            self._tooltip_win.withdraw()
     
     def show_splash_screen(self):
         """Animated splash screen with warm aesthetics"""
-        self.splash = tk.Frame(self.root, bg=self.THEME['bg'])
+        T = self.THEME
+        self.splash = tk.Frame(self.root, bg=T['bg'])
         self.splash.pack(fill=tk.BOTH, expand=True)
         
         # Centered content
-        center = tk.Frame(self.splash, bg=self.THEME['bg'])
+        center = tk.Frame(self.splash, bg=T['bg'])
         center.place(relx=0.5, rely=0.5, anchor='center')
         
         # House icon with decorative elements
         tk.Label(center, text="🏠", font=("Segoe UI", 96),
-                bg=self.THEME['bg'], fg=self.THEME['accent_coral']).pack()
+                bg=T['bg'], fg=T['accent_coral']).pack()
         
         tk.Label(center, text="D E C O R U M", font=("Georgia", 52, "bold"),
-                bg=self.THEME['bg'], fg=self.THEME['text_dark']).pack(pady=10)
+                bg=T['bg'], fg=T['text_dark']).pack(pady=10)
         
         tk.Label(center, text="─── ✿ ───", 
-                font=("Segoe UI", 18), bg=self.THEME['bg'], 
-                fg=self.THEME['accent_lavender']).pack(pady=5)
+                font=("Segoe UI", 18), bg=T['bg'], 
+                fg=T['accent_lavender']).pack(pady=5)
         
         tk.Label(center, text="A Cooperative Decorating Experience", 
-                font=("Georgia", 18, "italic"), bg=self.THEME['bg'], 
-                fg=self.THEME['text_medium']).pack(pady=15)
+                font=("Georgia", 18, "italic"), bg=T['bg'], 
+                fg=T['text_medium']).pack(pady=15)
         
         # Decorative icons
-        icons_frame = tk.Frame(center, bg=self.THEME['bg'])
+        icons_frame = tk.Frame(center, bg=T['bg'])
         icons_frame.pack(pady=30)
         for icon in ["💡", "🖼️", "🏺", "🎨"]:
             tk.Label(icons_frame, text=icon, font=("Segoe UI", 28),
-                    bg=self.THEME['bg']).pack(side=tk.LEFT, padx=15)
+                    bg=T['bg']).pack(side=tk.LEFT, padx=15)
         
         # Loading animation
         self.loading_label = tk.Label(center, text="● ○ ○", 
                                      font=("Segoe UI", 18),
-                                     bg=self.THEME['bg'], fg=self.THEME['accent_mint'])
+                                     bg=T['bg'], fg=T['accent_mint'])
         self.loading_label.pack(pady=30)
         self.animate_loading(0)
         
@@ -445,101 +975,102 @@ class DecorumGame:
     
     def show_setup(self):
         """Setup screen with warm pastel styling"""
+        T = self.THEME
         if hasattr(self, 'splash'):
             self.splash.destroy()
         
-        self.setup_frame = tk.Frame(self.root, bg=self.THEME['bg'])
+        self.setup_frame = tk.Frame(self.root, bg=T['bg'])
         self.setup_frame.pack(fill=tk.BOTH, expand=True)
         
         # Header bar
-        header = tk.Frame(self.setup_frame, bg=self.THEME['panel'], height=70)
+        header = tk.Frame(self.setup_frame, bg=T['panel'], height=70)
         header.pack(fill=tk.X)
         header.pack_propagate(False)
         
         tk.Label(header, text="🏠 DECORUM", font=("Georgia", 26, "bold"),
-                bg=self.THEME['panel'], fg=self.THEME['text_dark']).pack(side=tk.LEFT, padx=30, pady=15)
+                bg=T['panel'], fg=T['text_dark']).pack(side=tk.LEFT, padx=30, pady=15)
         
         tk.Label(header, text="✿ Game Setup", font=("Georgia", 14, "italic"),
-                bg=self.THEME['panel'], fg=self.THEME['accent_coral']).pack(side=tk.RIGHT, padx=30, pady=20)
+                bg=T['panel'], fg=T['accent_coral']).pack(side=tk.RIGHT, padx=30, pady=20)
         
         # Soft shadow line
-        tk.Frame(self.setup_frame, bg=self.THEME['border'], height=2).pack(fill=tk.X)
+        tk.Frame(self.setup_frame, bg=T['border'], height=2).pack(fill=tk.X)
         
         # Main content area
-        content = tk.Frame(self.setup_frame, bg=self.THEME['bg'])
+        content = tk.Frame(self.setup_frame, bg=T['bg'])
         content.pack(expand=True, fill=tk.BOTH, padx=60, pady=40)
         
         # Players Card
-        players_card = tk.Frame(content, bg=self.THEME['panel'], padx=50, pady=35,
-                               highlightbackground=self.THEME['border'], highlightthickness=1)
+        players_card = tk.Frame(content, bg=T['panel'], padx=50, pady=35,
+                               highlightbackground=T['border'], highlightthickness=1)
         players_card.pack(pady=20)
         
         tk.Label(players_card, text="👥 Players", font=("Georgia", 18, "bold"),
-                bg=self.THEME['panel'], fg=self.THEME['text_dark']).pack(anchor='w', pady=(0,20))
+                bg=T['panel'], fg=T['text_dark']).pack(anchor='w', pady=(0,20))
         
         # Player 1
-        p1_frame = tk.Frame(players_card, bg=self.THEME['panel'])
+        p1_frame = tk.Frame(players_card, bg=T['panel'])
         p1_frame.pack(fill=tk.X, pady=8)
         
         tk.Label(p1_frame, text="🔴", font=("Segoe UI", 16),
-                bg=self.THEME['panel']).pack(side=tk.LEFT)
+                bg=T['panel']).pack(side=tk.LEFT)
         tk.Label(p1_frame, text="Player 1:", font=("Segoe UI", 13),
-                bg=self.THEME['panel'], fg=self.player_colors[0], width=10, anchor='w').pack(side=tk.LEFT, padx=(5,10))
+                bg=T['panel'], fg=self.player_colors[0], width=10, anchor='w').pack(side=tk.LEFT, padx=(5,10))
         self.p1_entry = tk.Entry(p1_frame, font=("Segoe UI", 13), width=25,
-                                bg=self.THEME['bg_alt'], fg=self.THEME['text_dark'],
-                                insertbackground=self.THEME['text_dark'], relief=tk.FLAT,
-                                highlightbackground=self.THEME['border'], highlightthickness=1)
+                                bg=T['bg_alt'], fg=T['text_dark'],
+                                insertbackground=T['text_dark'], relief=tk.FLAT,
+                                highlightbackground=T['border'], highlightthickness=1)
         self.p1_entry.insert(0, "Alice")
         self.p1_entry.pack(side=tk.LEFT, ipady=10, padx=5)
         
         # Player 2
-        p2_frame = tk.Frame(players_card, bg=self.THEME['panel'])
+        p2_frame = tk.Frame(players_card, bg=T['panel'])
         p2_frame.pack(fill=tk.X, pady=8)
         
         tk.Label(p2_frame, text="🔵", font=("Segoe UI", 16),
-                bg=self.THEME['panel']).pack(side=tk.LEFT)
+                bg=T['panel']).pack(side=tk.LEFT)
         tk.Label(p2_frame, text="Player 2:", font=("Segoe UI", 13),
-                bg=self.THEME['panel'], fg=self.player_colors[1], width=10, anchor='w').pack(side=tk.LEFT, padx=(5,10))
+                bg=T['panel'], fg=self.player_colors[1], width=10, anchor='w').pack(side=tk.LEFT, padx=(5,10))
         self.p2_entry = tk.Entry(p2_frame, font=("Segoe UI", 13), width=25,
-                                bg=self.THEME['bg_alt'], fg=self.THEME['text_dark'],
-                                insertbackground=self.THEME['text_dark'], relief=tk.FLAT,
-                                highlightbackground=self.THEME['border'], highlightthickness=1)
+                                bg=T['bg_alt'], fg=T['text_dark'],
+                                insertbackground=T['text_dark'], relief=tk.FLAT,
+                                highlightbackground=T['border'], highlightthickness=1)
         self.p2_entry.insert(0, "Bob")
         self.p2_entry.pack(side=tk.LEFT, ipady=10, padx=5)
         
         # Game Mode Card
-        mode_card = tk.Frame(content, bg=self.THEME['panel'], padx=50, pady=35,
-                            highlightbackground=self.THEME['border'], highlightthickness=1)
+        mode_card = tk.Frame(content, bg=T['panel'], padx=50, pady=35,
+                            highlightbackground=T['border'], highlightthickness=1)
         mode_card.pack(pady=20)
         
         tk.Label(mode_card, text="🎮 Game Mode", font=("Georgia", 18, "bold"),
-                bg=self.THEME['panel'], fg=self.THEME['text_dark']).pack(anchor='w', pady=(0,25))
+                bg=T['panel'], fg=T['text_dark']).pack(anchor='w', pady=(0,25))
         
-        buttons_frame = tk.Frame(mode_card, bg=self.THEME['panel'])
+        buttons_frame = tk.Frame(mode_card, bg=T['panel'])
         buttons_frame.pack()
         
         StyledButton(buttons_frame, "Random Conditions", lambda: self.start_game("random"),
-                    bg_color=self.THEME['accent_mint'], hover_color="#4DB6AC",
+                    bg_color=T['accent_mint'], hover_color="#4DB6AC",
                     fg_color="white", icon="🎲", font_size=12, padx=25, pady=12).pack(side=tk.LEFT, padx=10)
         
         StyledButton(buttons_frame, "Custom Conditions", lambda: self.start_game("custom"),
-                    bg_color=self.THEME['accent_lavender'], hover_color="#9575CD",
+                    bg_color=T['accent_lavender'], hover_color="#9575CD",
                     fg_color="white", icon="📝", font_size=12, padx=25, pady=12).pack(side=tk.LEFT, padx=10)
         
         StyledButton(buttons_frame, "Load Scenario", lambda: self.start_game("file"),
-                    bg_color=self.THEME['accent_peach'], hover_color="#FF8A65",
+                    bg_color=T['accent_peach'], hover_color="#FF8A65",
                     fg_color="white", icon="📁", font_size=12, padx=25, pady=12).pack(side=tk.LEFT, padx=10)
         
         # How to play hint
-        hint_frame = tk.Frame(content, bg=self.THEME['bg_alt'], padx=30, pady=20)
+        hint_frame = tk.Frame(content, bg=T['bg_alt'], padx=30, pady=20)
         hint_frame.pack(pady=30, fill=tk.X)
         
         tk.Label(hint_frame, text="💡 How to Play", font=("Georgia", 14, "bold"),
-                bg=self.THEME['bg_alt'], fg=self.THEME['text_dark']).pack(anchor='w')
+                bg=T['bg_alt'], fg=T['text_dark']).pack(anchor='w')
         tk.Label(hint_frame, text="Work together to decorate the house! Each player has secret conditions.\n"
                                   "Use reactions (😊 😐 😠) to hint at how changes affect your conditions.\n"
                                   "You have 30 turns and 3 Heart-to-Hearts to discuss openly.",
-                font=("Segoe UI", 11), bg=self.THEME['bg_alt'], fg=self.THEME['text_medium'],
+                font=("Segoe UI", 11), bg=T['bg_alt'], fg=T['text_medium'],
                 justify='left').pack(anchor='w', pady=(10,0))
     
     def start_game(self, mode):
@@ -564,23 +1095,21 @@ class DecorumGame:
             self.load_scenario_file()
     
     def show_custom_conditions_dialog(self):
+        T = self.THEME
         dialog = tk.Toplevel(self.root)
+        dialog.withdraw()  # shown once fully built, see the end of this method
         dialog.title("Custom Conditions")
-        dialog.geometry("900x780")
-        dialog.configure(bg=self.THEME['bg'])
-        dialog.transient(self.root)
-        dialog.grab_set()
-        self.center_window(dialog, 900, 780)
+        dialog.configure(bg=T['bg'])
         
         tk.Label(dialog, text="📝 Guided Conditions & Starting Setup", font=("Georgia", 22, "bold"),
-                bg=self.THEME['bg'], fg=self.THEME['text_dark']).pack(pady=20)
+                bg=T['bg'], fg=T['text_dark']).pack(pady=20)
         
-        content = tk.Frame(dialog, bg=self.THEME['bg'])
+        content = tk.Frame(dialog, bg=T['bg'])
         content.pack(fill=tk.BOTH, expand=True)
         
         # Scrollable area for both players
-        canvas = tk.Canvas(content, bg=self.THEME['bg'], highlightthickness=0)
-        scroll = tk.Frame(canvas, bg=self.THEME['bg'])
+        canvas = tk.Canvas(content, bg=T['bg'], highlightthickness=0)
+        scroll = tk.Frame(canvas, bg=T['bg'])
         scrollbar = ttk.Scrollbar(content, orient="vertical", command=canvas.yview)
         canvas.configure(yscrollcommand=scrollbar.set)
         canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
@@ -590,43 +1119,57 @@ class DecorumGame:
         
         def on_mousewheel(event):
             canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-        canvas.bind_all("<MouseWheel>", on_mousewheel)
+        # Bound on the dialog (which every child widget inherits) rather than
+        # bind_all, so it scrolls over the chips and goes away with the dialog
+        dialog.bind("<MouseWheel>", on_mousewheel)
+        # X11 reports the wheel as buttons 4 and 5 rather than <MouseWheel>
+        dialog.bind("<Button-4>", lambda e: canvas.yview_scroll(-1, "units"))
+        dialog.bind("<Button-5>", lambda e: canvas.yview_scroll(1, "units"))
         
-        colors = {c.name_str: c for c in Color}
-        styles = {s.name_str: s for s in Style}
-        types = {t.name_str: t for t in ObjectType}
+        colors, styles, types = COLORS_BY_NAME, STYLES_BY_NAME, TYPES_BY_NAME
         
         def build_player_section(parent, player_idx):
-            section = tk.Frame(parent, bg=self.THEME['panel'], padx=20, pady=15,
-                              highlightbackground=self.THEME['border'], highlightthickness=1)
+            section = tk.Frame(parent, bg=T['panel'], padx=20, pady=15,
+                              highlightbackground=T['border'], highlightthickness=1)
             section.pack(fill=tk.X, padx=40, pady=8)
             
             tk.Label(section, text=f"{'🔴' if player_idx==0 else '🔵'} {self.player_names[player_idx]}'s Conditions",
-                    font=("Segoe UI", 13, "bold"), bg=self.THEME['panel'],
+                    font=("Segoe UI", 13, "bold"), bg=T['panel'],
                     fg=self.player_colors[player_idx]).pack(anchor='w')
             
             conds = []
-            list_frame = tk.Frame(section, bg=self.THEME['bg_alt'])
+            list_frame = tk.Frame(section, bg=T['bg_alt'])
             list_frame.pack(fill=tk.X, pady=6)
-            list_items = []
+            list_items = []  # (chip, icon, text, remove button), reused across refreshes
+            
+            def make_chip():
+                chip = tk.Frame(list_frame, bg="#FFFFFF", padx=8, pady=4,
+                               highlightbackground=T['border'], highlightthickness=1)
+                icon_label = tk.Label(chip, font=("Segoe UI", 10),
+                                      bg="#FFFFFF", fg=T['text_medium'])
+                icon_label.pack(side=tk.LEFT, padx=(0,6))
+                text_label = tk.Label(chip, font=("Segoe UI", 10),
+                                      bg="#FFFFFF", fg=T['text_dark'], anchor='w')
+                text_label.pack(side=tk.LEFT, fill=tk.X, expand=True)
+                remove_btn = tk.Button(chip, text="✕", font=("Segoe UI", 9),
+                                       bg="#FFFFFF", fg=T['text_light'], relief=tk.FLAT)
+                remove_btn.pack(side=tk.RIGHT)
+                return chip, icon_label, text_label, remove_btn
             
             def refresh():
-                for w in list_frame.winfo_children():
-                    w.destroy()
-                list_items.clear()
+                # Update chips in place; create only when the list grows and
+                # hide (not destroy) the surplus when it shrinks
                 for idx, c in enumerate(conds):
-                    chip = tk.Frame(list_frame, bg="#FFFFFF", padx=8, pady=4,
-                                   highlightbackground=self.THEME['border'], highlightthickness=1)
-                    chip.pack(fill=tk.X, pady=2)
+                    if idx == len(list_items):
+                        list_items.append(make_chip())
+                    chip, icon_label, text_label, remove_btn = list_items[idx]
                     icon = "🎯" if isinstance(c, (RoomHasColor, RoomWallColor, RoomHasObjectType)) else "📌"
-                    tk.Label(chip, text=icon, font=("Segoe UI", 10),
-                            bg="#FFFFFF", fg=self.THEME['text_medium']).pack(side=tk.LEFT, padx=(0,6))
-                    tk.Label(chip, text=str(c), font=("Segoe UI", 10),
-                            bg="#FFFFFF", fg=self.THEME['text_dark'], anchor='w').pack(side=tk.LEFT, fill=tk.X, expand=True)
-                    tk.Button(chip, text="✕", font=("Segoe UI", 9),
-                             bg="#FFFFFF", fg=self.THEME['text_light'],
-                             relief=tk.FLAT, command=lambda i=idx: remove_at(i)).pack(side=tk.RIGHT)
-                    list_items.append(chip)
+                    icon_label.configure(text=icon)
+                    text_label.configure(text=str(c))
+                    remove_btn.configure(command=lambda i=idx: remove_at(i))
+                    chip.pack(fill=tk.X, pady=2)
+                for chip, *_ in list_items[len(conds):]:
+                    chip.pack_forget()
             
             def add_cond(cond):
                 conds.append(cond)
@@ -646,110 +1189,54 @@ class DecorumGame:
                 conds.extend(random_conds)
                 refresh()
             
-            btn_row = tk.Frame(section, bg=self.THEME['panel'])
+            btn_row = tk.Frame(section, bg=T['panel'])
             btn_row.pack(fill=tk.X, pady=(0,8))
             tk.Button(btn_row, text="Clear All", command=clear_all,
-                     bg=self.THEME['bg_alt'], fg=self.THEME['text_dark'], relief=tk.FLAT).pack(side=tk.LEFT, padx=4)
+                     bg=T['bg_alt'], fg=T['text_dark'], relief=tk.FLAT).pack(side=tk.LEFT, padx=4)
             tk.Button(btn_row, text="Add 3 Random", command=add_random,
-                     bg=self.THEME['accent_mint'], fg='white', relief=tk.FLAT).pack(side=tk.RIGHT, padx=4)
+                     bg=T['accent_mint'], fg='white', relief=tk.FLAT).pack(side=tk.RIGHT, padx=4)
             
-            builder = tk.Frame(section, bg=self.THEME['panel'])
+            builder = tk.Frame(section, bg=T['panel'])
             builder.pack(fill=tk.X, pady=(6,0))
             
-            # Room has color object
-            row = tk.Frame(builder, bg=self.THEME['panel'])
-            row.pack(fill=tk.X, pady=2)
-            tk.Label(row, text="Room has color object:", font=("Segoe UI", 9),
-                    bg=self.THEME['panel'], fg=self.THEME['text_medium']).pack(side=tk.LEFT)
-            room_var = tk.StringVar(value=ROOM_NAMES[0])
-            ttk.Combobox(row, textvariable=room_var, values=ROOM_NAMES, state='readonly', width=12).pack(side=tk.LEFT, padx=4)
-            color_var = tk.StringVar(value=Color.RED.name_str)
-            ttk.Combobox(row, textvariable=color_var, values=list(colors.keys()), state='readonly', width=8).pack(side=tk.LEFT, padx=4)
-            tk.Button(row, text="Add", command=lambda: add_cond(
-                RoomHasColor(ROOM_NAMES.index(room_var.get()), room_var.get(), colors[color_var.get()])),
-                bg=self.THEME['bg_alt'], relief=tk.FLAT).pack(side=tk.RIGHT)
+            panel, bg_alt, text_medium = T['panel'], T['bg_alt'], T['text_medium']
+            font_row = ("Segoe UI", 9)
+            count_1_3, count_1_2 = ("1", "2", "3"), ("1", "2")
             
-            # Room walls must be color
-            row = tk.Frame(builder, bg=self.THEME['panel'])
-            row.pack(fill=tk.X, pady=2)
-            tk.Label(row, text="Room walls must be color:", font=("Segoe UI", 9),
-                    bg=self.THEME['panel'], fg=self.THEME['text_medium']).pack(side=tk.LEFT)
-            room_var2 = tk.StringVar(value=ROOM_NAMES[0])
-            ttk.Combobox(row, textvariable=room_var2, values=ROOM_NAMES, state='readonly', width=12).pack(side=tk.LEFT, padx=4)
-            color_var2 = tk.StringVar(value=Color.BLUE.name_str)
-            ttk.Combobox(row, textvariable=color_var2, values=list(colors.keys()), state='readonly', width=8).pack(side=tk.LEFT, padx=4)
-            tk.Button(row, text="Add", command=lambda: add_cond(
-                RoomWallColor(ROOM_NAMES.index(room_var2.get()), room_var2.get(), colors[color_var2.get()])),
-                bg=self.THEME['bg_alt'], relief=tk.FLAT).pack(side=tk.RIGHT)
+            def cond_row(text, combos, build):
+                """One builder row: label, a combobox per (values, default, width), Add button"""
+                row = tk.Frame(builder, bg=panel)
+                row.pack(fill=tk.X, pady=2)
+                tk.Label(row, text=text, font=font_row,
+                        bg=panel, fg=text_medium).pack(side=tk.LEFT)
+                variables = []
+                for values, default, width in combos:
+                    var = tk.StringVar(value=default)
+                    ttk.Combobox(row, textvariable=var, values=values, state='readonly', width=width).pack(side=tk.LEFT, padx=4)
+                    variables.append(var)
+                tk.Button(row, text="Add", command=lambda: add_cond(build(*[v.get() for v in variables])),
+                    bg=bg_alt, relief=tk.FLAT).pack(side=tk.RIGHT)
             
-            # Room must have object type
-            row = tk.Frame(builder, bg=self.THEME['panel'])
-            row.pack(fill=tk.X, pady=2)
-            tk.Label(row, text="Room must have object type:", font=("Segoe UI", 9),
-                    bg=self.THEME['panel'], fg=self.THEME['text_medium']).pack(side=tk.LEFT)
-            room_var3 = tk.StringVar(value=ROOM_NAMES[0])
-            ttk.Combobox(row, textvariable=room_var3, values=ROOM_NAMES, state='readonly', width=12).pack(side=tk.LEFT, padx=4)
-            type_var = tk.StringVar(value=ObjectType.LAMP.name_str)
-            ttk.Combobox(row, textvariable=type_var, values=list(types.keys()), state='readonly', width=10).pack(side=tk.LEFT, padx=4)
-            tk.Button(row, text="Add", command=lambda: add_cond(
-                RoomHasObjectType(ROOM_NAMES.index(room_var3.get()), room_var3.get(), types[type_var.get()])),
-                bg=self.THEME['bg_alt'], relief=tk.FLAT).pack(side=tk.RIGHT)
-            
-            # At least N objects of color
-            row = tk.Frame(builder, bg=self.THEME['panel'])
-            row.pack(fill=tk.X, pady=2)
-            tk.Label(row, text="At least N objects of color:", font=("Segoe UI", 9),
-                    bg=self.THEME['panel'], fg=self.THEME['text_medium']).pack(side=tk.LEFT)
-            count_var = tk.StringVar(value="2")
-            ttk.Combobox(row, textvariable=count_var, values=["1", "2", "3"], state='readonly', width=4).pack(side=tk.LEFT, padx=4)
-            color_var3 = tk.StringVar(value=Color.RED.name_str)
-            ttk.Combobox(row, textvariable=color_var3, values=list(colors.keys()), state='readonly', width=8).pack(side=tk.LEFT, padx=4)
-            tk.Button(row, text="Add", command=lambda: add_cond(
-                MinObjectsOfColor(colors[color_var3.get()], int(count_var.get()))),
-                bg=self.THEME['bg_alt'], relief=tk.FLAT).pack(side=tk.RIGHT)
-            
-            # At least N objects of style
-            row = tk.Frame(builder, bg=self.THEME['panel'])
-            row.pack(fill=tk.X, pady=2)
-            tk.Label(row, text="At least N objects of style:", font=("Segoe UI", 9),
-                    bg=self.THEME['panel'], fg=self.THEME['text_medium']).pack(side=tk.LEFT)
-            count_var2 = tk.StringVar(value="2")
-            ttk.Combobox(row, textvariable=count_var2, values=["1", "2"], state='readonly', width=4).pack(side=tk.LEFT, padx=4)
-            style_var = tk.StringVar(value=Style.MODERN.name_str)
-            ttk.Combobox(row, textvariable=style_var, values=list(styles.keys()), state='readonly', width=10).pack(side=tk.LEFT, padx=4)
-            tk.Button(row, text="Add", command=lambda: add_cond(
-                MinObjectsOfStyle(styles[style_var.get()], int(count_var2.get()))),
-                bg=self.THEME['bg_alt'], relief=tk.FLAT).pack(side=tk.RIGHT)
-            
-            # No objects of color
-            row = tk.Frame(builder, bg=self.THEME['panel'])
-            row.pack(fill=tk.X, pady=2)
-            tk.Label(row, text="No objects of color:", font=("Segoe UI", 9),
-                    bg=self.THEME['panel'], fg=self.THEME['text_medium']).pack(side=tk.LEFT)
-            color_var4 = tk.StringVar(value=Color.GREEN.name_str)
-            ttk.Combobox(row, textvariable=color_var4, values=list(colors.keys()), state='readonly', width=8).pack(side=tk.LEFT, padx=4)
-            tk.Button(row, text="Add", command=lambda: add_cond(
-                NoObjectsOfColor(colors[color_var4.get()])),
-                bg=self.THEME['bg_alt'], relief=tk.FLAT).pack(side=tk.RIGHT)
-            
-            # Every room must have type
-            row = tk.Frame(builder, bg=self.THEME['panel'])
-            row.pack(fill=tk.X, pady=2)
-            tk.Label(row, text="Every room must have type:", font=("Segoe UI", 9),
-                    bg=self.THEME['panel'], fg=self.THEME['text_medium']).pack(side=tk.LEFT)
-            type_var2 = tk.StringVar(value=ObjectType.LAMP.name_str)
-            ttk.Combobox(row, textvariable=type_var2, values=list(types.keys()), state='readonly', width=10).pack(side=tk.LEFT, padx=4)
-            tk.Button(row, text="Add", command=lambda: add_cond(
-                EveryRoomHasType(types[type_var2.get()])),
-                bg=self.THEME['bg_alt'], relief=tk.FLAT).pack(side=tk.RIGHT)
-            
-            # All styles present
-            row = tk.Frame(builder, bg=self.THEME['panel'])
-            row.pack(fill=tk.X, pady=2)
-            tk.Label(row, text="All styles present:", font=("Segoe UI", 9),
-                    bg=self.THEME['panel'], fg=self.THEME['text_medium']).pack(side=tk.LEFT)
-            tk.Button(row, text="Add", command=lambda: add_cond(AllStylesPresent()),
-                bg=self.THEME['bg_alt'], relief=tk.FLAT).pack(side=tk.RIGHT)
+            room_combo = (ROOM_NAMES, ROOM_NAMES[0], 12)
+            row_specs = (
+                ("Room has color object:", (room_combo, (_COLOR_NAMES, Color.RED.name_str, 8)),
+                 lambda room, color: RoomHasColor(ROOM_NAMES.index(room), room, colors[color])),
+                ("Room walls must be color:", (room_combo, (_COLOR_NAMES, Color.BLUE.name_str, 8)),
+                 lambda room, color: RoomWallColor(ROOM_NAMES.index(room), room, colors[color])),
+                ("Room must have object type:", (room_combo, (_TYPE_NAMES, ObjectType.LAMP.name_str, 10)),
+                 lambda room, obj_type: RoomHasObjectType(ROOM_NAMES.index(room), room, types[obj_type])),
+                ("At least N objects of color:", ((count_1_3, "2", 4), (_COLOR_NAMES, Color.RED.name_str, 8)),
+                 lambda count, color: MinObjectsOfColor(colors[color], int(count))),
+                ("At least N objects of style:", ((count_1_2, "2", 4), (_STYLE_NAMES, Style.MODERN.name_str, 10)),
+                 lambda count, style: MinObjectsOfStyle(styles[style], int(count))),
+                ("No objects of color:", ((_COLOR_NAMES, Color.GREEN.name_str, 8),),
+                 lambda color: NoObjectsOfColor(colors[color])),
+                ("Every room must have type:", ((_TYPE_NAMES, ObjectType.LAMP.name_str, 10),),
+                 lambda obj_type: EveryRoomHasType(types[obj_type])),
+                ("All styles present:", (), AllStylesPresent),
+            )
+            for text, combos, build in row_specs:
+                cond_row(text, combos, build)
             
             return conds
         
@@ -757,49 +1244,53 @@ class DecorumGame:
         p2_conditions = build_player_section(scroll, 1)
         
         # ===== Starting House Setup =====
-        setup_card = tk.Frame(scroll, bg=self.THEME['panel'], padx=25, pady=20,
-                             highlightbackground=self.THEME['border'], highlightthickness=1)
+        setup_card = tk.Frame(scroll, bg=T['panel'], padx=25, pady=20,
+                             highlightbackground=T['border'], highlightthickness=1)
         setup_card.pack(fill=tk.X, padx=40, pady=10)
         
         tk.Label(setup_card, text="🏠 Starting House Setup (optional)", 
-                font=("Segoe UI", 13, "bold"), bg=self.THEME['panel'], 
-                fg=self.THEME['text_dark']).pack(anchor='w')
+                font=("Segoe UI", 13, "bold"), bg=T['panel'], 
+                fg=T['text_dark']).pack(anchor='w')
         
-        setup_grid = tk.Frame(setup_card, bg=self.THEME['panel'])
+        setup_grid = tk.Frame(setup_card, bg=T['panel'])
         setup_grid.pack(pady=10)
         
         # Build 4 rows (rooms) x wall color + 3 object slots
-        setup_vars = {}
-        wall_vars = {}
         room_headers = ["Living Room", "Bedroom", "Kitchen", "Bathroom"]
         type_headers = [ObjectType.LAMP, ObjectType.WALL_HANGING, ObjectType.CURIO]
+        # Indexed [room][type_headers position] and [room]
+        setup_vars = [[None] * len(type_headers) for _ in room_headers]
+        wall_vars = [None] * len(room_headers)
         
-        tk.Label(setup_grid, text="", bg=self.THEME['panel']).grid(row=0, column=0, padx=5)
+        tk.Label(setup_grid, text="", bg=T['panel']).grid(row=0, column=0, padx=5)
         tk.Label(setup_grid, text="🎨 Wall Color", font=("Segoe UI", 9, "bold"),
-                bg=self.THEME['panel'], fg=self.THEME['text_medium']).grid(row=0, column=1, padx=10, pady=5)
+                bg=T['panel'], fg=T['text_medium']).grid(row=0, column=1, padx=10, pady=5)
         for col, obj_type in enumerate(type_headers, start=2):
             tk.Label(setup_grid, text=f"{obj_type.emoji} {obj_type.name_str}", font=("Segoe UI", 9, "bold"),
-                    bg=self.THEME['panel'], fg=self.THEME['text_medium']).grid(row=0, column=col, padx=10, pady=5)
+                    bg=T['panel'], fg=T['text_medium']).grid(row=0, column=col, padx=10, pady=5)
         
-        def combo_label(obj_type, style):
-            color = VALID_OBJECTS_MAP[obj_type][style]
-            return f"{style.name_str} {color.name_str}"
+        # Same choices in every room, so build them once per object type
+        values_for_type = {t: ["Empty"] + [f"{s.name_str} {color.name_str}"
+                                           for s, color in VALID_OBJECTS_MAP[t].items()]
+                           for t in type_headers}
+        # Display string -> (style, color); every entry is a valid object by construction
+        choice_to_object = {f"{s.name_str} {color.name_str}": (s, color)
+                            for t in type_headers for s, color in VALID_OBJECTS_MAP[t].items()}
         
         for r, room_name in enumerate(room_headers, start=1):
             tk.Label(setup_grid, text=room_name, font=("Segoe UI", 9),
-                    bg=self.THEME['panel'], fg=self.THEME['text_dark']).grid(row=r, column=0, sticky='w', padx=5)
+                    bg=T['panel'], fg=T['text_dark']).grid(row=r, column=0, sticky='w', padx=5)
             wall_var = tk.StringVar(value=self.house.rooms[r-1].wall_color.name_str)
-            wall_combo = ttk.Combobox(setup_grid, textvariable=wall_var, values=list(colors.keys()),
+            wall_combo = ttk.Combobox(setup_grid, textvariable=wall_var, values=_COLOR_NAMES,
                                      state='readonly', width=12)
             wall_combo.grid(row=r, column=1, padx=6, pady=3)
             wall_vars[r-1] = wall_var
             for c, obj_type in enumerate(type_headers, start=2):
                 var = tk.StringVar(value="Empty")
-                values = ["Empty"] + [combo_label(obj_type, s) for s in Style]
-                combo = ttk.Combobox(setup_grid, textvariable=var, values=values,
+                combo = ttk.Combobox(setup_grid, textvariable=var, values=values_for_type[obj_type],
                                     state='readonly', width=16)
                 combo.grid(row=r, column=c, padx=6, pady=3)
-                setup_vars[(r-1, obj_type)] = var
+                setup_vars[r-1][c-2] = var
         
         def apply():
             if not p1_conditions or not p2_conditions:
@@ -810,49 +1301,52 @@ class DecorumGame:
             self.player_conditions = [list(p1_conditions), list(p2_conditions)]
             
             # Apply wall colors
-            for room_idx, var in wall_vars.items():
-                self.house.rooms[room_idx].wall_color = colors[var.get()]
+            for room_idx, var in enumerate(wall_vars):
+                self.house.paint(room_idx, colors[var.get()])
             
             # Apply starting setup
-            for (room_idx, obj_type), var in setup_vars.items():
-                choice = var.get()
-                if choice == "Empty":
-                    continue
-                parts = choice.split()
-                style_name, color_name = parts[0], parts[1]
-                style = styles[style_name]
-                color = colors[color_name]
-                if is_valid_object(obj_type, color, style):
-                    self.house.rooms[room_idx].set_slot(obj_type, GameObject(obj_type, color, style))
+            for room_idx, row_vars in enumerate(setup_vars):
+                for c, var in enumerate(row_vars):
+                    obj_type = type_headers[c]
+                    pair = choice_to_object.get(var.get())  # None for "Empty"
+                    if pair:
+                        style, color = pair
+                        self.house.place(room_idx, obj_type, GameObject(obj_type, color, style))
             
             dialog.destroy()
             self.show_conditions_reveal()
-            canvas.unbind_all("<MouseWheel>")
         
         StyledButton(dialog, "Start Game", apply,
-                    bg_color=self.THEME['accent_mint'], hover_color="#4DB6AC",
+                    bg_color=T['accent_mint'], hover_color="#4DB6AC",
                     fg_color="white", icon="▶", font_size=14, padx=40, pady=14).pack(pady=18)
+        
+        self.center_window(dialog, 900, 780)
+        dialog.transient(self.root)
+        dialog.deiconify()
+        dialog.grab_set()
     
     def load_scenario_file(self):
         filename = filedialog.askopenfilename(title="Select Scenario", filetypes=[("JSON", "*.json")])
         if filename:
             try:
-                with open(filename, 'r') as f:
-                    data = json.load(f)
+                with open(filename, 'rb') as f:
+                    raw = f.read()
+                data = orjson.loads(raw) if orjson is not None else json.loads(raw)
                 for line in data.get("player1_conditions", []):
                     cond = parse_condition_text(line)
                     if cond: self.player_conditions[0].append(cond)
                 for line in data.get("player2_conditions", []):
                     cond = parse_condition_text(line)
                     if cond: self.player_conditions[1].append(cond)
-                if "starting_objects" in data:
-                    for obj_data in data["starting_objects"]:
-                        room_idx = obj_data.get("room", 0)
-                        obj_type = ObjectType[obj_data["type"].upper().replace(" ", "_")]
-                        color = Color[obj_data["color"].upper()]
-                        style = Style[obj_data["style"].upper()]
-                        if is_valid_object(obj_type, color, style):
-                            self.house.rooms[room_idx].set_slot(obj_type, GameObject(obj_type, color, style))
+                house = self.house
+                for obj_data in data.get("starting_objects", ()):
+                    room_idx = obj_data.get("room", 0)
+                    # An unknown name raises KeyError, reported below like any bad file
+                    obj_type = TYPE_LOOKUP[obj_data["type"].lower()]
+                    color = COLOR_LOOKUP[obj_data["color"].lower()]
+                    style = STYLE_LOOKUP[obj_data["style"].lower()]
+                    if is_valid_object(obj_type, color, style):
+                        house.place(room_idx, obj_type, GameObject(obj_type, color, style))
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to load: {e}")
                 self.player_conditions[0], self.player_conditions[1] = generate_random_conditions()
@@ -861,366 +1355,523 @@ class DecorumGame:
         self.show_conditions_reveal()
     
     def show_conditions_reveal(self):
-        """Condition reveal with warm styling"""
-        for i, name in enumerate(self.player_names):
-            reveal = tk.Toplevel(self.root)
-            reveal.title(f"{name}'s Conditions")
-            reveal.geometry("520x450")
-            reveal.configure(bg=self.THEME['bg'])
-            reveal.transient(self.root)
-            reveal.grab_set()
-            self.center_window(reveal, 520, 450)
-            
-            # Header with player color
+        """Condition reveal with warm styling, one player at a time in one window"""
+        T = self.THEME
+        reveal = tk.Toplevel(self.root)
+        reveal.configure(bg=T['bg'])
+        reveal.transient(self.root)
+        reveal.grab_set()
+        self.center_window(reveal, 520, 450)
+        
+        # Header in the player's color, filled in per player below
+        lock_label = tk.Label(reveal, text="🔒", font=("Segoe UI", 52), bg=T['bg'])
+        lock_label.pack(pady=20)
+        
+        title_label = tk.Label(reveal, font=("Georgia", 20, "bold"), bg=T['bg'])
+        title_label.pack()
+        
+        tk.Label(reveal, text="─── ✿ ───", 
+                font=("Segoe UI", 14), bg=T['bg'], 
+                fg=T['border']).pack(pady=10)
+        
+        # Conditions card
+        cond_frame = tk.Frame(reveal, bg=T['panel'], padx=35, pady=25,
+                             highlightbackground=T['border'], highlightthickness=1)
+        cond_frame.pack(pady=15, padx=40, fill=tk.X)
+        
+        tk.Label(reveal, text="⚠️ Keep this secret from the other player!", 
+                font=("Segoe UI", 11),
+                bg=T['bg'], fg=T['error']).pack(pady=15)
+        
+        # "Got it!" (or closing the window) moves on to the next player; a
+        # callback rather than wait_variable(), which would nest an event loop
+        shown = -1
+        
+        def next_player():
+            nonlocal shown
+            shown += 1
+            if shown == len(self.player_names):
+                reveal.destroy()
+                self._all_conditions = self.player_conditions[0] + self.player_conditions[1]
+                self.house.track_conditions(self._all_conditions)
+                self.build_game_ui()
+                return
+            i, name = shown, self.player_names[shown]
             header_color = self.player_colors[i]
+            reveal.title(f"{name}'s Conditions")
+            lock_label.configure(fg=header_color)
+            title_label.configure(text=f"{name}'s Secret Conditions", fg=header_color)
             
-            tk.Label(reveal, text="🔒", font=("Segoe UI", 52),
-                    bg=self.THEME['bg'], fg=header_color).pack(pady=20)
-            
-            tk.Label(reveal, text=f"{name}'s Secret Conditions", 
-                    font=("Georgia", 20, "bold"),
-                    bg=self.THEME['bg'], fg=header_color).pack()
-            
-            tk.Label(reveal, text="─── ✿ ───", 
-                    font=("Segoe UI", 14), bg=self.THEME['bg'], 
-                    fg=self.THEME['border']).pack(pady=10)
-            
-            # Conditions card
-            cond_frame = tk.Frame(reveal, bg=self.THEME['panel'], padx=35, pady=25,
-                                 highlightbackground=self.THEME['border'], highlightthickness=1)
-            cond_frame.pack(pady=15, padx=40, fill=tk.X)
-            
+            for w in cond_frame.winfo_children():
+                w.destroy()
             for c in self.player_conditions[i]:
                 tk.Label(cond_frame, text=f"✦  {c}", font=("Segoe UI", 12),
-                        bg=self.THEME['panel'], fg=self.THEME['text_dark'],
+                        bg=T['panel'], fg=T['text_dark'],
                         anchor='w').pack(fill=tk.X, pady=5)
             
-            tk.Label(reveal, text="⚠️ Keep this secret from the other player!", 
-                    font=("Segoe UI", 11),
-                    bg=self.THEME['bg'], fg=self.THEME['error']).pack(pady=15)
-            
-            StyledButton(reveal, "Got it!", reveal.destroy,
-                        bg_color=header_color, hover_color=self.player_dark_colors[i],
-                        fg_color="white", font_size=12, padx=30, pady=10).pack(pady=10)
-            
-            self.root.wait_window(reveal)
+            ack_button.restyle("Got it!", header_color, self.player_dark_colors[i])
         
-        self.build_game_ui()
+        ack_button = StyledButton(reveal, "Got it!", next_player,
+                                  fg_color="white", font_size=12, padx=30, pady=10)
+        ack_button.pack(pady=10)
+        reveal.protocol("WM_DELETE_WINDOW", next_player)
+        next_player()
     
     def center_window(self, win, w, h):
-        win.update_idletasks()
-        x = (win.winfo_screenwidth() - w) // 2
-        y = (win.winfo_screenheight() - h) // 2
-        win.geometry(f"{w}x{h}+{x}+{y}")
+        sw, sh = self._screen_size
+        win.geometry(f"{w}x{h}+{(sw - w) // 2}+{(sh - h) // 2}")
+    
+    def _dialog(self, name, build):
+        """The hidden dialog cached under name, made by build() on first use.
+        
+        build(dialog) fills in a new withdrawn Toplevel and returns a dict of
+        the widgets later opens update; the dialog itself is added as 'dialog'.
+        """
+        parts = self._dialogs.get(name)
+        if parts is None or not parts['dialog'].winfo_exists():
+            dialog = tk.Toplevel(self.root)
+            dialog.withdraw()
+            dialog.configure(bg=self.THEME['bg'])
+            dialog.transient(self.root)
+            dialog.protocol("WM_DELETE_WINDOW", lambda: self._hide_dialog(dialog))
+            parts = build(dialog)
+            parts['dialog'] = dialog
+            self._dialogs[name] = parts
+        return parts
+    
+    def _show_dialog(self, dialog, w, h):
+        self.center_window(dialog, w, h)
+        dialog.deiconify()
+        dialog.lift()
+        dialog.grab_set()
+    
+    @staticmethod
+    def _hide_dialog(dialog):
+        dialog.grab_release()
+        dialog.withdraw()
+    
+    def request_redraw(self):
+        """Refresh the game UI once the event loop is idle.
+        
+        Several state changes handled in one callback then cost a single
+        refresh instead of one each.
+        """
+        if self._batch_depth:
+            self._redraw_deferred = True
+        elif not self._redraw_pending:
+            self._redraw_pending = True
+            self.root.after_idle(self._do_redraw)
+    
+    @contextmanager
+    def batched_updates(self):
+        """Hold back redraws requested inside the block until the outermost one exits.
+        
+        Unlike request_redraw() alone, this survives an update_idletasks()
+        partway through the block.
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._redraw_deferred:
+                self._redraw_deferred = False
+                self.request_redraw()
+    
+    def _do_redraw(self):
+        self._redraw_pending = False
+        self.update_game_ui()
     
     def build_game_ui(self):
-        """Build the main game interface with improved UX"""
+        """Build the main game interface once; update_game_ui() keeps it current"""
         for w in self.root.winfo_children():
             w.destroy()
+        T = self.THEME
+        panel = T['panel']
+        self._applied = {}  # widget path -> options last passed through _apply
+        self._tooltip_texts = {}
         
         # ===== HEADER BAR =====
-        header = tk.Frame(self.root, bg=self.THEME['panel'], height=80)
+        header = tk.Frame(self.root, bg=panel, height=80)
         header.pack(fill=tk.X)
         header.pack_propagate(False)
         
         # Logo
-        logo_frame = tk.Frame(header, bg=self.THEME['panel'])
+        logo_frame = tk.Frame(header, bg=panel)
         logo_frame.pack(side=tk.LEFT, padx=25)
         tk.Label(logo_frame, text="🏠", font=("Segoe UI", 32),
-                bg=self.THEME['panel']).pack(side=tk.LEFT)
+                bg=panel).pack(side=tk.LEFT)
         tk.Label(logo_frame, text="DECORUM", font=("Georgia", 24, "bold"),
-                bg=self.THEME['panel'], fg=self.THEME['text_dark']).pack(side=tk.LEFT, padx=10)
+                bg=panel, fg=T['text_dark']).pack(side=tk.LEFT, padx=10)
         
         # Round counter (increments after both players)
-        turn_frame = tk.Frame(header, bg=self.THEME['bg_alt'], padx=20, pady=8)
+        turn_frame = tk.Frame(header, bg=T['bg_alt'], padx=20, pady=8)
         turn_frame.pack(side=tk.LEFT, padx=30)
-        round_count = (self.turn_count // 2) + 1
-        tk.Label(turn_frame, text=f"⏱ Round {round_count}",
-                font=("Segoe UI", 12, "bold"), bg=self.THEME['bg_alt'], fg=self.THEME['success']).pack()
-        tk.Label(turn_frame, text=f"Actions taken: {self.turn_count}",
-                font=("Segoe UI", 9), bg=self.THEME['bg_alt'], fg=self.THEME['text_medium']).pack()
+        self.round_label = tk.Label(turn_frame, font=("Segoe UI", 12, "bold"),
+                                    bg=T['bg_alt'], fg=T['success'])
+        self.round_label.pack()
+        self.actions_label = tk.Label(turn_frame, font=("Segoe UI", 9),
+                                      bg=T['bg_alt'], fg=T['text_medium'])
+        self.actions_label.pack()
         
         # Heart-to-heart counter
-        hth_frame = tk.Frame(header, bg=self.THEME['bg_alt'], padx=15, pady=8)
+        hth_frame = tk.Frame(header, bg=T['bg_alt'], padx=15, pady=8)
         hth_frame.pack(side=tk.LEFT, padx=5)
-        hearts_left = self.max_heart_to_heart - self.heart_to_heart_used
-        heart_icons = "❤️" * hearts_left + "🤍" * self.heart_to_heart_used
-        tk.Label(hth_frame, text=f"Heart-to-Heart: {heart_icons}",
-                font=("Segoe UI", 11), bg=self.THEME['bg_alt'], fg=self.THEME['text_medium']).pack()
+        self.hearts_label = tk.Label(hth_frame, font=("Segoe UI", 11),
+                                     bg=T['bg_alt'], fg=T['text_medium'])
+        self.hearts_label.pack()
         
         # Current player indicator (prominent)
-        player_indicator = tk.Frame(header, bg=self.player_colors[self.current_player], padx=25, pady=12)
-        player_indicator.pack(side=tk.RIGHT, padx=25, pady=15)
-        
-        player_emoji = "🔴" if self.current_player == 0 else "🔵"
-        tk.Label(player_indicator, text=f"{player_emoji} {self.player_names[self.current_player]}'s Turn",
-                font=("Segoe UI", 14, "bold"), bg=self.player_colors[self.current_player], fg='white').pack()
+        self.player_indicator = tk.Frame(header, padx=25, pady=12)
+        self.player_indicator.pack(side=tk.RIGHT, padx=25, pady=15)
+        self.player_label = tk.Label(self.player_indicator, font=("Segoe UI", 14, "bold"), fg='white')
+        self.player_label.pack()
         
         # Shadow line
-        tk.Frame(self.root, bg=self.THEME['border'], height=2).pack(fill=tk.X)
+        tk.Frame(self.root, bg=T['border'], height=2).pack(fill=tk.X)
         
         # ===== MAIN CONTENT =====
-        main = tk.Frame(self.root, bg=self.THEME['bg'])
+        main = tk.Frame(self.root, bg=T['bg'])
         main.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
         
         # ===== LEFT: HOUSE PANEL =====
-        house_panel = tk.Frame(main, bg=self.THEME['panel'],
-                              highlightbackground=self.THEME['border'], highlightthickness=1)
+        house_panel = tk.Frame(main, bg=panel,
+                              highlightbackground=T['border'], highlightthickness=1)
         house_panel.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0,15))
         
         # House header
-        house_header = tk.Frame(house_panel, bg=self.THEME['panel'])
+        house_header = tk.Frame(house_panel, bg=panel)
         house_header.pack(fill=tk.X, padx=20, pady=15)
         
         tk.Label(house_header, text="🏡 The House", font=("Georgia", 18, "bold"),
-                bg=self.THEME['panel'], fg=self.THEME['text_dark']).pack(side=tk.LEFT)
+                bg=panel, fg=T['text_dark']).pack(side=tk.LEFT)
         
         # Selection info in header
-        if self.selected_room is not None:
-            room = self.house.rooms[self.selected_room]
-            sel_text = f"Selected: {room.name}"
-            if self.selected_slot:
-                obj = room.get_slot(self.selected_slot)
-                sel_text += f" → {self.selected_slot.name_str}"
-                if obj:
-                    sel_text += f" ({obj.color.name_str} {obj.style.name_str})"
-            tk.Label(house_header, text=sel_text, font=("Segoe UI", 11),
-                    bg=self.THEME['panel'], fg=self.THEME['accent_coral']).pack(side=tk.RIGHT)
-        else:
-            tk.Label(house_header, text="Click a room to select it",
-                    font=("Segoe UI", 11), bg=self.THEME['panel'], 
-                    fg=self.THEME['text_light']).pack(side=tk.RIGHT)
+        self.house_sel_label = tk.Label(house_header, font=("Segoe UI", 11), bg=panel)
+        self.house_sel_label.pack(side=tk.RIGHT)
         
         # Rooms grid (2x2)
-        rooms_frame = tk.Frame(house_panel, bg=self.THEME['panel'])
-        rooms_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=(5,20))
+        self.rooms_frame = tk.Frame(house_panel, bg=panel)
+        self.rooms_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=(5,20))
         
-        self.room_borders.clear()
-        self.room_glows.clear()
-        for i, room in enumerate(self.house.rooms):
-            row, col = i // 2, i % 2
-            room_card = self.create_room_card(rooms_frame, room, i)
-            room_card.grid(row=row, column=col, padx=10, pady=10, sticky="nsew")
+        self.rooms_frame.grid_columnconfigure(0, weight=1)
+        self.rooms_frame.grid_columnconfigure(1, weight=1)
+        self.rooms_frame.grid_rowconfigure(0, weight=1)
+        self.rooms_frame.grid_rowconfigure(1, weight=1)
         
-        rooms_frame.grid_columnconfigure(0, weight=1)
-        rooms_frame.grid_columnconfigure(1, weight=1)
-        rooms_frame.grid_rowconfigure(0, weight=1)
-        rooms_frame.grid_rowconfigure(1, weight=1)
+        self.room_cards = []
+        for i in range(len(self.house.rooms)):
+            room_card = self.create_room_card(self.rooms_frame, i)
+            room_card['shadow'].grid(row=i // 2, column=i % 2, padx=10, pady=10, sticky="nsew")
+            self.room_cards.append(room_card)
         
         # ===== RIGHT: CONTROL PANEL =====
-        control = tk.Frame(main, bg=self.THEME['panel'], width=320,
-                          highlightbackground=self.THEME['border'], highlightthickness=1)
+        control = tk.Frame(main, bg=panel, width=320,
+                          highlightbackground=T['border'], highlightthickness=1)
         control.pack(side=tk.RIGHT, fill=tk.Y)
         control.pack_propagate(False)
         
-        # Scrollable control area
-        control_canvas = tk.Canvas(control, bg=self.THEME['panel'], highlightthickness=0)
-        control_scroll = tk.Frame(control_canvas, bg=self.THEME['panel'])
+        # Control area
+        control_body = tk.Frame(control, bg=panel)
+        control_body.pack(fill=tk.BOTH, expand=True)
         
-        control_canvas.pack(fill=tk.BOTH, expand=True)
-        control_canvas.create_window((0, 0), window=control_scroll, anchor="nw", width=318)
+        # Blocks that come and go are built once and swapped in and out of
+        # these holders by update_game_ui(), which keeps them in order
+        self.turn_state_holder = tk.Frame(control_body, bg=panel)
+        self.turn_state_holder.pack(fill=tk.X)
         
         # ===== TURN STATE INDICATOR =====
-        if self.action_taken_this_turn:
-            # Action taken - show waiting for reaction / end turn
-            state_frame = tk.Frame(control_scroll, bg=self.THEME['accent_gold'], padx=15, pady=15)
-            state_frame.pack(fill=tk.X, padx=10, pady=10)
-            
-            tk.Label(state_frame, text="✓ Action Complete!", font=("Georgia", 14, "bold"),
-                    bg=self.THEME['accent_gold'], fg=self.THEME['text_dark']).pack()
-            tk.Label(state_frame, text=f"Partner ({self.player_names[1-self.current_player]}) may react,\nthen end your turn.",
-                    font=("Segoe UI", 10), bg=self.THEME['accent_gold'], 
-                    fg=self.THEME['text_dark'], justify='center').pack(pady=(5,0))
-            
-            StyledButton(state_frame, "↩ Undo Last Action", self.undo_last_action,
-                        bg_color=self.THEME['accent_rose'], hover_color="#EC407A",
-                        fg_color="white", font_size=10, padx=12, pady=6).pack(pady=(8,0))
-        else:
-            # Current Selection Card (compact)
-            sel_card = tk.Frame(control_scroll, bg=self.room_colors[self.selected_room]['bg'] if self.selected_room is not None else self.THEME['bg_alt'],
-                               padx=15, pady=12)
-            sel_card.pack(fill=tk.X, padx=10, pady=10)
-            
-            if self.selected_room is not None:
-                room = self.house.rooms[self.selected_room]
-                header_row = tk.Frame(sel_card, bg=sel_card.cget('bg'))
-                header_row.pack(fill=tk.X)
-                tk.Label(header_row, text=room.icon, font=("Segoe UI", 28),
-                        bg=sel_card.cget('bg')).pack(side=tk.LEFT)
-                name_label = tk.Label(header_row, text=room.name, font=("Georgia", 14, "bold"),
-                        bg=sel_card.cget('bg'), fg=self.THEME['text_dark'])
-                name_label.pack(side=tk.LEFT, padx=8)
-                
-                # Deselect button
-                desel_btn = tk.Button(header_row, text="✕", font=("Segoe UI", 10),
-                                     bg=sel_card.cget('bg'), fg=self.THEME['text_light'],
-                                     relief=tk.FLAT, cursor='hand2', bd=0,
-                                     command=self.deselect_room)
-                desel_btn.pack(side=tk.RIGHT)
-                
-                wall_label = tk.Label(header_row, text=f"🎨{room.wall_color.name_str}",
-                        font=("Segoe UI", 9), bg=sel_card.cget('bg'),
-                        fg=self.THEME['text_medium'])
-                wall_label.pack(side=tk.RIGHT, padx=10)
-                
-                if self.selected_slot:
-                    obj = room.get_slot(self.selected_slot)
-                    slot_text = f"{self.selected_slot.emoji} {self.selected_slot.name_str}"
-                    if obj:
-                        slot_text += f" • {obj.color.name_str} {obj.style.name_str}"
-                    slot_label = tk.Label(sel_card, text=slot_text, font=("Segoe UI", 10),
-                            bg=sel_card.cget('bg'), fg=self.THEME['text_medium'])
-                    slot_label.pack(anchor='w', pady=(5,0))
-                    self.selection_labels["slot"] = slot_label
-                self.selection_labels["room"] = name_label
-                self.selection_labels["wall"] = wall_label
-            else:
-                empty_label = tk.Label(sel_card, text="📍 Click a room to select", font=("Segoe UI", 11),
-                        bg=sel_card.cget('bg'), fg=self.THEME['text_light'])
-                empty_label.pack()
-                tk.Label(sel_card, text="(1 action per turn)", font=("Segoe UI", 9),
-                        bg=sel_card.cget('bg'), fg=self.THEME['text_light']).pack()
-                self.selection_labels["empty"] = empty_label
+        # Action taken - show waiting for reaction / end turn
+        self.state_frame = tk.Frame(self.turn_state_holder, bg=T['accent_gold'], padx=15, pady=15)
+        tk.Label(self.state_frame, text="✓ Action Complete!", font=("Georgia", 14, "bold"),
+                bg=T['accent_gold'], fg=T['text_dark']).pack()
+        self.state_hint = tk.Label(self.state_frame, font=("Segoe UI", 10), bg=T['accent_gold'],
+                                   fg=T['text_dark'], justify='center')
+        self.state_hint.pack(pady=(5,0))
+        StyledButton(self.state_frame, "↩ Undo Last Action", self.undo_last_action,
+                    bg_color=T['accent_rose'], hover_color="#EC407A",
+                    fg_color="white", font_size=10, padx=12, pady=6).pack(pady=(8,0))
+        
+        # Current Selection Card (compact); its background follows the selected room
+        self.sel_card = tk.Frame(self.turn_state_holder, padx=15, pady=12)
+        self.sel_room_block = tk.Frame(self.sel_card)
+        self.sel_header_row = tk.Frame(self.sel_room_block)
+        self.sel_icon = tk.Label(self.sel_header_row, font=("Segoe UI", 28))
+        self.sel_icon.pack(side=tk.LEFT)
+        self.sel_name = tk.Label(self.sel_header_row, font=("Georgia", 14, "bold"), fg=T['text_dark'])
+        self.sel_name.pack(side=tk.LEFT, padx=8)
+        
+        # Deselect button
+        desel_btn = tk.Button(self.sel_header_row, text="✕", font=("Segoe UI", 10),
+                             fg=T['text_light'],
+                             relief=tk.FLAT, cursor='hand2', bd=0,
+                             command=self.deselect_room)
+        desel_btn.pack(side=tk.RIGHT)
+        
+        self.sel_wall = tk.Label(self.sel_header_row, font=("Segoe UI", 9), fg=T['text_medium'])
+        self.sel_wall.pack(side=tk.RIGHT, padx=10)
+        self.sel_slot = tk.Label(self.sel_room_block, font=("Segoe UI", 10), fg=T['text_medium'])
+        
+        self.sel_empty_block = tk.Frame(self.sel_card)
+        empty_label = tk.Label(self.sel_empty_block, text="📍 Click a room to select", font=("Segoe UI", 11),
+                fg=T['text_light'])
+        empty_label.pack()
+        empty_hint = tk.Label(self.sel_empty_block, text="(1 action per turn)", font=("Segoe UI", 9),
+                fg=T['text_light'])
+        empty_hint.pack()
+        self._sel_card_widgets = [self.sel_card, self.sel_room_block, self.sel_header_row,
+                                  self.sel_icon, self.sel_name, desel_btn, self.sel_wall,
+                                  self.sel_slot, self.sel_empty_block, empty_label, empty_hint]
+        self._sel_card_bg = None  # color last applied to _sel_card_widgets
         
         # ===== END TURN - ALWAYS VISIBLE =====
-        end_frame = tk.Frame(control_scroll, bg=self.player_colors[self.current_player], padx=3, pady=3)
-        end_frame.pack(fill=tk.X, padx=10, pady=(5,10))
-        
-        end_text = f"⏭️  END TURN" if not self.action_taken_this_turn else f"⏭️  END TURN (Done!)"
-        StyledButton(end_frame, end_text, self.end_turn,
-                    bg_color=self.player_colors[self.current_player],
-                    hover_color=self.player_dark_colors[self.current_player],
-                    fg_color="white", font_size=12, padx=15, pady=10).pack(fill=tk.X)
+        # One pre-colored copy per player, swapped in by update_game_ui()
+        self.end_holder = tk.Frame(control_body, bg=panel)
+        self.end_holder.pack(fill=tk.X)
+        self.end_frames, self.end_buttons = [], []
+        for player_color, dark_color in zip(self.player_colors, self.player_dark_colors):
+            end_frame = tk.Frame(self.end_holder, bg=player_color, padx=3, pady=3)
+            end_button = StyledButton(end_frame, "", self.end_turn,
+                                      bg_color=player_color, hover_color=dark_color,
+                                      fg_color="white", font_size=12, padx=15, pady=10)
+            end_button.pack(fill=tk.X)
+            self.end_frames.append(end_frame)
+            self.end_buttons.append(end_button)
         
         # ===== ACTIONS SECTION =====
-        if self.action_taken_this_turn:
-            # Actions disabled - show grayed out
-            tk.Label(control_scroll, text="─── Action Used ───", font=("Georgia", 11),
-                    bg=self.THEME['panel'], fg=self.THEME['text_light']).pack(pady=(5,8))
-            
-            disabled_frame = tk.Frame(control_scroll, bg='#E0E0E0', padx=10, pady=15)
-            disabled_frame.pack(fill=tk.X, padx=10)
-            tk.Label(disabled_frame, text="1 action per turn\n(already taken)", font=("Segoe UI", 10),
-                    bg='#E0E0E0', fg='#999999', justify='center').pack()
-        else:
-            # Actions available
-            tk.Label(control_scroll, text="─── Actions (pick 1) ───", font=("Georgia", 11),
-                    bg=self.THEME['panel'], fg=self.THEME['text_light']).pack(pady=(5,8))
-            
-            actions_frame = tk.Frame(control_scroll, bg=self.THEME['panel'])
-            actions_frame.pack(fill=tk.X, padx=10)
-            
-            # 2x2 grid for actions
-            action_row1 = tk.Frame(actions_frame, bg=self.THEME['panel'])
-            action_row1.pack(fill=tk.X, pady=2)
-            action_row2 = tk.Frame(actions_frame, bg=self.THEME['panel'])
-            action_row2.pack(fill=tk.X, pady=2)
-            
-            StyledButton(action_row1, "➕ Add", self.action_add,
-                        bg_color=self.THEME['success'], hover_color="#66BB6A",
-                        fg_color="white", font_size=10, padx=8, pady=6).pack(side=tk.LEFT, expand=True, fill=tk.X, padx=2)
-            StyledButton(action_row1, "➖ Remove", self.action_remove,
-                        bg_color=self.THEME['error'], hover_color="#EF5350",
-                        fg_color="white", font_size=10, padx=8, pady=6).pack(side=tk.LEFT, expand=True, fill=tk.X, padx=2)
-            
-            StyledButton(action_row2, "🔄 Swap", self.action_swap,
-                        bg_color=self.THEME['accent_lavender'], hover_color="#9575CD",
-                        fg_color="white", font_size=10, padx=8, pady=6).pack(side=tk.LEFT, expand=True, fill=tk.X, padx=2)
-            StyledButton(action_row2, "🎨 Paint", self.action_paint,
-                        bg_color=self.THEME['accent_peach'], hover_color="#FF8A65",
-                        fg_color="white", font_size=10, padx=8, pady=6).pack(side=tk.LEFT, expand=True, fill=tk.X, padx=2)
+        self.actions_holder = tk.Frame(control_body, bg=panel)
+        self.actions_holder.pack(fill=tk.X)
+        
+        # Actions disabled - show grayed out
+        self.disabled_block = tk.Frame(self.actions_holder, bg=panel)
+        tk.Label(self.disabled_block, text="─── Action Used ───", font=("Georgia", 11),
+                bg=panel, fg=T['text_light']).pack(pady=(5,8))
+        
+        disabled_frame = tk.Frame(self.disabled_block, bg='#E0E0E0', padx=10, pady=15)
+        disabled_frame.pack(fill=tk.X, padx=10)
+        tk.Label(disabled_frame, text="1 action per turn\n(already taken)", font=("Segoe UI", 10),
+                bg='#E0E0E0', fg='#999999', justify='center').pack()
+        
+        # Actions available
+        self.actions_block = tk.Frame(self.actions_holder, bg=panel)
+        tk.Label(self.actions_block, text="─── Actions (pick 1) ───", font=("Georgia", 11),
+                bg=panel, fg=T['text_light']).pack(pady=(5,8))
+        
+        actions_frame = tk.Frame(self.actions_block, bg=panel)
+        actions_frame.pack(fill=tk.X, padx=10)
+        
+        # 2x2 grid for actions
+        action_row1 = tk.Frame(actions_frame, bg=panel)
+        action_row1.pack(fill=tk.X, pady=2)
+        action_row2 = tk.Frame(actions_frame, bg=panel)
+        action_row2.pack(fill=tk.X, pady=2)
+        
+        StyledButton(action_row1, "➕ Add", self.action_add,
+                    bg_color=T['success'], hover_color="#66BB6A",
+                    fg_color="white", font_size=10, padx=8, pady=6).pack(side=tk.LEFT, expand=True, fill=tk.X, padx=2)
+        StyledButton(action_row1, "➖ Remove", self.action_remove,
+                    bg_color=T['error'], hover_color="#EF5350",
+                    fg_color="white", font_size=10, padx=8, pady=6).pack(side=tk.LEFT, expand=True, fill=tk.X, padx=2)
+        
+        StyledButton(action_row2, "🔄 Swap", self.action_swap,
+                    bg_color=T['accent_lavender'], hover_color="#9575CD",
+                    fg_color="white", font_size=10, padx=8, pady=6).pack(side=tk.LEFT, expand=True, fill=tk.X, padx=2)
+        StyledButton(action_row2, "🎨 Paint", self.action_paint,
+                    bg_color=T['accent_peach'], hover_color="#FF8A65",
+                    fg_color="white", font_size=10, padx=8, pady=6).pack(side=tk.LEFT, expand=True, fill=tk.X, padx=2)
         
         # ===== REACTIONS SECTION =====
-        tk.Label(control_scroll, text="─── Reactions ───", font=("Georgia", 11),
-                bg=self.THEME['panel'], fg=self.THEME['text_light']).pack(pady=(12,8))
+        tk.Label(control_body, text="─── Reactions ───", font=("Georgia", 11),
+                bg=panel, fg=T['text_light']).pack(pady=(12,8))
         
-        react_frame = tk.Frame(control_scroll, bg=self.THEME['panel'])
+        react_frame = tk.Frame(control_body, bg=panel)
         react_frame.pack()
         
         # Reactions are for the OTHER player after action is taken
-        reactions = [("😊", "happy", self.THEME['success']), 
+        reactions = [("😊", "happy", T['success']), 
                     ("😐", "neutral", "#BDBDBD"), 
-                    ("😠", "unhappy", self.THEME['error'])]
+                    ("😠", "unhappy", T['error'])]
         
         for emoji, reaction, color in reactions:
             btn = tk.Button(react_frame, text=emoji, font=("Segoe UI", 22), width=3,
-                           bg=self.THEME['bg_alt'], fg=self.THEME['text_dark'],
+                           bg=T['bg_alt'], fg=T['text_dark'],
                            relief=tk.FLAT, cursor='hand2', bd=0,
                            activebackground=color,
                            command=lambda r=reaction: self.react(r))
             btn.pack(side=tk.LEFT, padx=6)
-            btn.bind("<Enter>", lambda e, b=btn, c=color: b.configure(bg=c))
-            btn.bind("<Leave>", lambda e, b=btn: b.configure(bg=self.THEME['bg_alt']))
+            bind_hover(btn, T['bg_alt'], color)
         
         # Reaction hint / persistent indicator
-        if self.action_taken_this_turn:
-            tk.Label(control_scroll, text=f"👆 {self.player_names[1-self.current_player]}: React to the change!",
-                    font=("Segoe UI", 9, "bold"), bg=self.THEME['panel'],
-                    fg=self.THEME['accent_coral']).pack(pady=(5,0))
-        if self.last_reactions[1-self.current_player]:
-            react_emoji = {"happy": "😊", "neutral": "😐", "unhappy": "😠"}
-            last_r = self.last_reactions[1-self.current_player]
-            self.reaction_label = tk.Label(control_scroll, text=f"Partner reaction: {react_emoji.get(last_r, '')}",
-                    font=("Segoe UI", 11, "bold"), bg=self.THEME['panel'],
-                    fg=self.THEME['accent_coral'])
-            self.reaction_label.pack(pady=(6,0))
+        self.hint_holder = tk.Frame(control_body, bg=panel)
+        self.hint_holder.pack(fill=tk.X)
+        self.reaction_hint = tk.Label(self.hint_holder, font=("Segoe UI", 9, "bold"), bg=panel,
+                                      fg=T['accent_coral'])
+        self.reaction_label = tk.Label(self.hint_holder, font=("Segoe UI", 11, "bold"), bg=panel,
+                                       fg=T['accent_coral'])
         
         # Game Actions Section  
-        tk.Label(control_scroll, text="───────────", font=("Georgia", 10),
-                bg=self.THEME['panel'], fg=self.THEME['text_light']).pack(pady=8)
+        tk.Label(control_body, text="───────────", font=("Georgia", 10),
+                bg=panel, fg=T['text_light']).pack(pady=8)
         
-        game_actions = tk.Frame(control_scroll, bg=self.THEME['panel'])
+        game_actions = tk.Frame(control_body, bg=panel)
         game_actions.pack(fill=tk.X, padx=10)
         
         StyledButton(game_actions, "👁️ My Conditions", self.show_my_conditions,
-                    bg_color=self.THEME['bg_alt'], hover_color=self.THEME['border'],
-                    fg_color=self.THEME['text_dark'], font_size=10, padx=10, pady=5).pack(fill=tk.X, pady=2)
+                    bg_color=T['bg_alt'], hover_color=T['border'],
+                    fg_color=T['text_dark'], font_size=10, padx=10, pady=5).pack(fill=tk.X, pady=2)
         
         StyledButton(game_actions, "💕 Heart-to-Heart", self.heart_to_heart,
-                    bg_color=self.THEME['accent_rose'], hover_color="#EC407A",
+                    bg_color=T['accent_rose'], hover_color="#EC407A",
                     fg_color="white", font_size=10, padx=10, pady=5).pack(fill=tk.X, pady=2)
         
         StyledButton(game_actions, "✓ Check Win", self.check_win,
-                    bg_color=self.THEME['accent_gold'], hover_color="#FFC107",
-                    fg_color=self.THEME['text_dark'], font_size=10, padx=10, pady=6).pack(fill=tk.X, pady=4)
+                    bg_color=T['accent_gold'], hover_color="#FFC107",
+                    fg_color=T['text_dark'], font_size=10, padx=10, pady=6).pack(fill=tk.X, pady=4)
+        
+        self.update_game_ui()
     
-    def create_room_card(self, parent, room, idx):
-        """Create a simple, space-efficient room card"""
-        is_selected = (idx == self.selected_room)
-
-        border_color = room.wall_color.hex_color
-        border_width = 5 if is_selected else 3
-
+    @staticmethod
+    def _repack(holder, shown):
+        """Pack exactly the (widget, pack options) pairs in shown into holder, in order"""
+        widgets = [w for w, _ in shown]
+        # Remembered on the holder, so the usual no-change call needs no Tk query
+        if getattr(holder, 'packed', None) == widgets:
+            return
+        holder.packed = widgets
+        for w in holder.pack_slaves():
+            w.pack_forget()
+        for w, opts in shown:
+            w.pack(**opts)
+    
+    def _apply(self, widget, **options):
+        """widget.configure(**options), skipped when it would change nothing"""
+        key = str(widget)
+        if self._applied.get(key) != options:
+            self._applied[key] = options
+            widget.configure(**options)
+    
+    def update_game_ui(self):
+        """Bring the widgets made by build_game_ui() in line with the game state"""
+        cp = self.current_player
+        partner_name = self.player_names[1 - cp]
+        player_color = self.player_colors[cp]
+        
+        # Header
+        self._apply(self.round_label, text=f"⏱ Round {(self.turn_count // 2) + 1}")
+        self._apply(self.actions_label, text=f"Actions taken: {self.turn_count}")
+        hearts_left = self.max_heart_to_heart - self.heart_to_heart_used
+        heart_icons = "❤️" * hearts_left + "🤍" * self.heart_to_heart_used
+        self._apply(self.hearts_label, text=f"Heart-to-Heart: {heart_icons}")
+        player_emoji = "🔴" if cp == 0 else "🔵"
+        self._apply(self.player_indicator, bg=player_color)
+        self._apply(self.player_label, text=f"{player_emoji} {self.player_names[cp]}'s Turn",
+                    bg=player_color)
+        
+        self._refresh_room_cards()
+        
+        # Turn state: "action complete" card, or the selection card
+        if self.action_taken_this_turn:
+            self._apply(self.state_hint, text=f"Partner ({partner_name}) may react,\nthen end your turn.")
+            self._repack(self.turn_state_holder, [(self.state_frame, dict(fill=tk.X, padx=10, pady=10))])
+        else:
+            self._repack(self.turn_state_holder, [(self.sel_card, dict(fill=tk.X, padx=10, pady=10))])
+        self._update_selection_info()
+        
+        # End turn
+        end_text = "⏭️  END TURN" if not self.action_taken_this_turn else "⏭️  END TURN (Done!)"
+        self._apply(self.end_buttons[cp], text=end_text)
+        self._repack(self.end_holder, [(self.end_frames[cp],
+                                        dict(fill=tk.X, padx=10, pady=(5,10)))])
+        
+        # Actions
+        block = self.disabled_block if self.action_taken_this_turn else self.actions_block
+        self._repack(self.actions_holder, [(block, dict(fill=tk.X))])
+        
+        # Reaction hint / persistent indicator
+        shown = []
+        if self.action_taken_this_turn:
+            self._apply(self.reaction_hint, text=f"👆 {partner_name}: React to the change!")
+            shown.append((self.reaction_hint, dict(pady=(5,0))))
+        last_r = self.last_reactions[1 - cp]
+        if last_r:
+            react_emoji = {"happy": "😊", "neutral": "😐", "unhappy": "😠"}
+            self._apply(self.reaction_label, text=f"Partner reaction: {react_emoji.get(last_r, '')}")
+            shown.append((self.reaction_label, dict(pady=(6,0))))
+        self._repack(self.hint_holder, shown)
+    
+    def _update_selection_info(self):
+        """Selection text in the house header and the control panel's selection card"""
+        T = self.THEME
+        if self.selected_room is None:
+            self._apply(self.house_sel_label, text="Click a room to select it", fg=T['text_light'])
+            card_bg = T['bg_alt']
+            self._repack(self.sel_card, [(self.sel_empty_block, {})])
+        else:
+            room = self.house.rooms[self.selected_room]
+            sel_text = f"Selected: {room.name}"
+            slot_text = None
+            if self.selected_slot:
+                obj = room.get_slot(self.selected_slot)
+                sel_text += f" → {self.selected_slot.name_str}"
+                slot_text = f"{self.selected_slot.emoji} {self.selected_slot.name_str}"
+                if obj:
+                    sel_text += f" ({obj.color.name_str} {obj.style.name_str})"
+                    slot_text += f" • {obj.color.name_str} {obj.style.name_str}"
+            self._apply(self.house_sel_label, text=sel_text, fg=T['accent_coral'])
+            card_bg = self.room_colors[self.selected_room]['bg']
+            self._apply(self.sel_icon, text=room.icon)
+            self._apply(self.sel_name, text=room.name)
+            self._apply(self.sel_wall, text=_WALL_SEL_TEXT[room.wall_color])
+            shown = [(self.sel_header_row, dict(fill=tk.X))]
+            if slot_text:
+                self._apply(self.sel_slot, text=slot_text)
+                shown.append((self.sel_slot, dict(anchor='w', pady=(5,0))))
+            self._repack(self.sel_room_block, shown)
+            self._repack(self.sel_card, [(self.sel_room_block, dict(fill=tk.X))])
+        if card_bg != self._sel_card_bg:
+            self._sel_card_bg = card_bg
+            for w in self._sel_card_widgets:
+                w.configure(bg=card_bg)
+    
+    def _refresh_room_cards(self):
+        for idx in range(len(self.room_cards)):
+            self._refresh_room_card(idx)
+        self._shown_selected_room = self.selected_room
+    
+    def create_room_card(self, parent, idx):
+        """Create a simple, space-efficient room card.
+        
+        Returns the card's widgets; _refresh_room_card() fills in the room's
+        walls, contents and selection.
+        """
         shadow = tk.Frame(parent, bg="#D8D1C6")
-        outer = tk.Frame(shadow, bg=border_color, padx=border_width, pady=border_width)
+        outer = tk.Frame(shadow)
         outer.pack(fill=tk.BOTH, expand=True, padx=2, pady=2)
-        self.room_borders[idx] = outer
 
-        card_bg = room.wall_color.light_hex
-        header_bg = room.wall_color.dark_hex
-
-        card = tk.Frame(outer, bg=card_bg)
+        card = tk.Frame(outer)
         card.pack(fill=tk.BOTH, expand=True)
 
-        header = tk.Frame(card, bg=header_bg, height=36)
+        header = tk.Frame(card, height=36)
         header.pack(fill=tk.X)
         header.pack_propagate(False)
 
-        tk.Label(header, text=f"{room.icon} {room.name}", font=("Georgia", 11, "bold"),
-                bg=header_bg, fg="white").pack(side=tk.LEFT, padx=10)
-        tk.Label(header, text=f"● {room.wall_color.name_str}", font=("Segoe UI", 9, "bold"),
-                bg=header_bg, fg="white").pack(side=tk.RIGHT, padx=10)
-
-        for w in [header] + list(header.winfo_children()):
-            w.bind("<Button-1>", lambda e, i=idx: self.select_room(i))
+        room = self.house.rooms[idx]
+        title = ttk.Label(header, text=f"{room.icon} {room.name}", style="RoomTitle.TLabel")
+        title.pack(side=tk.LEFT, padx=10)
+        wall = ttk.Label(header, style="RoomWall.TLabel")
+        wall.pack(side=tk.RIGHT, padx=10)
+
+        # One class binding shared by the header and its labels via a bindtag
+        tag = f"room-{idx}"
+        self.root.bind_class(tag, "<Button-1>", lambda e, i=idx: self.select_room(i))
+        for w in (header, title, wall):
+            w.bindtags((tag,) + w.bindtags())
             w.configure(cursor="hand2")
 
-        if is_selected:
-            glow = tk.Frame(card, bg=self.THEME['accent_gold'], height=3)
-            glow.pack(fill=tk.X)
-            self.room_glows[idx] = glow
+        # Packed between header and body while the room is selected
+        glow = tk.Frame(card, bg=self.THEME['accent_gold'], height=3)
 
-        body = tk.Frame(card, bg=card_bg, padx=6, pady=6)
+        body = tk.Frame(card, padx=6, pady=6)
         body.pack(fill=tk.BOTH, expand=True)
 
         body.grid_columnconfigure(0, weight=1)
@@ -1228,27 +1879,50 @@ class DecorumGame:
         body.grid_rowconfigure(1, weight=1)
         body.grid_rowconfigure(2, weight=1)
 
-        slot_wall = self.create_object_slot(body, room, idx, ObjectType.WALL_HANGING, False, large=True)
-        slot_lamp = self.create_object_slot(body, room, idx, ObjectType.LAMP, False, large=True)
-        slot_curio = self.create_object_slot(body, room, idx, ObjectType.CURIO, False, large=True)
+        slots = {}
+        for row, obj_type in enumerate(_CARD_SLOT_TYPES):
+            slot = self.create_object_slot(body, idx, obj_type, False, large=True)
+            slot['frame'].grid(row=row, column=0, sticky="nsew", pady=(0, 4) if row < 2 else 0)
+            slots[obj_type] = slot
 
-        slot_wall.grid(row=0, column=0, sticky="nsew", pady=(0, 4))
-        slot_lamp.grid(row=1, column=0, sticky="nsew", pady=(0, 4))
-        slot_curio.grid(row=2, column=0, sticky="nsew")
-
-        return shadow
+        return {'shadow': shadow, 'border': outer, 'card': card, 'header': header,
+                'title': title, 'wall': wall, 'glow': glow, 'body': body,
+                'slots': slots, 'state': None}
     
-    def create_object_slot(self, parent, room, room_idx, obj_type, dimmed=False, large=False):
-        """Create a compact horizontal object slot"""
-        slot_frame = tk.Frame(parent, bg=parent.cget('bg'))
+    def _refresh_room_card(self, idx):
+        """Restyle a room card for its current walls, contents and selection"""
+        room = self.house.rooms[idx]
+        widgets = self.room_cards[idx]
+        is_selected = (idx == self.selected_room)
 
-        obj = room.get_slot(obj_type)
-        is_slot_selected = (room_idx == self.selected_room and obj_type == self.selected_slot)
+        wc = room.wall_color
+        state = (wc, is_selected)
+        if widgets['state'] != state:
+            widgets['state'] = state
+            border_width = 5 if is_selected else 3
+            card_bg = wc.light_hex
+            header_bg = wc.dark_hex
+            widgets['border'].configure(bg=wc.hex_color, padx=border_width, pady=border_width)
+            widgets['card'].configure(bg=card_bg)
+            widgets['body'].configure(bg=card_bg)
+            widgets['header'].configure(bg=header_bg)
+            widgets['title'].configure(style=_ROOM_TITLE_STYLE[wc])
+            widgets['wall'].configure(text=_WALL_CHIP_TEXT[wc], style=_ROOM_WALL_STYLE[wc])
+            for slot in widgets['slots'].values():
+                slot['frame'].configure(bg=card_bg)
+            if is_selected:
+                widgets['glow'].pack(fill=tk.X, before=widgets['body'])
+            else:
+                widgets['glow'].pack_forget()
 
-        slot_bg = self.THEME['accent_gold'] if is_slot_selected else '#FFFFFF'
-        inner_pad = 3 if is_slot_selected else 1
+        for obj_type, slot in widgets['slots'].items():
+            self._refresh_object_slot(slot, room, idx, obj_type)
+    
+    def create_object_slot(self, parent, room_idx, obj_type, dimmed=False, large=False):
+        """Create a compact horizontal object slot; _refresh_object_slot() fills it in"""
+        slot_frame = tk.Frame(parent)
 
-        slot_container = tk.Frame(slot_frame, bg=slot_bg, padx=inner_pad, pady=inner_pad)
+        slot_container = tk.Frame(slot_frame)
         slot_container.pack(fill=tk.BOTH, expand=True)
 
         inner = tk.Frame(slot_container, bg='#FFFFFF', padx=6, pady=5)
@@ -1257,52 +1931,60 @@ class DecorumGame:
         row = tk.Frame(inner, bg=inner.cget('bg'))
         row.pack(fill=tk.BOTH, expand=True)
 
-        type_label = tk.Label(row, text=f"{obj_type.emoji} {obj_type.name_str}",
-                              font=("Segoe UI", 9, "bold"),
-                              bg=inner.cget('bg'), fg=self.THEME['text_dark'],
-                              anchor='w', justify='left')
+        type_label = ttk.Label(row, text=f"{obj_type.emoji} {obj_type.name_str}",
+                               style="SlotType.TLabel")
         type_label.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 6))
 
-        if obj:
-            tile_bg = obj.color.hex_color if not dimmed else '#CFCBC4'
-            tile_size = 30 if large else 26
-            tile = tk.Frame(row, bg=tile_bg, width=tile_size, height=tile_size)
-            tile.pack(side=tk.LEFT, padx=(0, 6))
-            tile.pack_propagate(False)
-            fg = contrast_text_color(tile_bg)
-            tk.Label(tile, text=obj.style.symbol, font=("Segoe UI", 10, "bold"), bg=tile_bg, fg=fg).pack(expand=True)
-
-            meta = tk.Label(row, text=f"{obj.style.name_str} • {obj.color.name_str}",
-                            font=("Segoe UI", 8), bg=inner.cget('bg'),
-                            fg=self.THEME['text_medium'], anchor='e', justify='right',
-                            wraplength=180 if large else 120)
-            meta.pack(side=tk.RIGHT)
-
-            self.bind_tooltip(slot_container, lambda: obj.obj_type.name_str + "\n" + obj.style.name_str + " " + obj.color.name_str)
-        else:
-            tile = tk.Frame(row, bg='#F0ECE5', width=30 if large else 26, height=30 if large else 26)
-            tile.pack(side=tk.LEFT, padx=(0, 6))
-            tile.pack_propagate(False)
-            tk.Label(tile, text="+", font=("Segoe UI", 10, "bold"), bg='#F0ECE5', fg='#AFA8A0').pack(expand=True)
-
-            meta = tk.Label(row, text="Empty", font=("Segoe UI", 8),
-                            bg=inner.cget('bg'), fg='#AFA8A0', anchor='e')
-            meta.pack(side=tk.RIGHT)
-
-            self.bind_tooltip(slot_container, lambda: f"Empty {obj_type.name_str} slot")
+        tile_size = 30 if large else 26
+        tile = tk.Frame(row, width=tile_size, height=tile_size)
+        tile.pack(side=tk.LEFT, padx=(0, 6))
+        tile.pack_propagate(False)
+        symbol = tk.Label(tile, font=("Segoe UI", 10, "bold"))
+        symbol.pack(expand=True)
+
+        meta = ttk.Label(row, style="SlotMeta.TLabel")
+        meta.pack(side=tk.RIGHT)
+
+        def tooltip_text():
+            obj = self.house.rooms[room_idx].get_slot(obj_type)
+            if obj:
+                return obj.obj_type.name_str + "\n" + obj.style.name_str + " " + obj.color.name_str
+            return f"Empty {obj_type.name_str} slot"
+        self.bind_tooltip(slot_container, tooltip_text)
+
+        tag = f"slot-{room_idx}-{obj_type.name}"
+        self.root.bind_class(tag, "<Button-1>",
+                             lambda e, ri=room_idx, ot=obj_type: self.on_slot_click(ri, ot))
+        for w in (slot_frame, slot_container, inner, row, type_label, tile, symbol, meta):
+            w.bindtags((tag,) + w.bindtags())
+            w.configure(cursor="hand2")
 
-        def bind_click(widget):
-            try:
-                widget.bind("<Button-1>", lambda e, ri=room_idx, ot=obj_type: self.on_slot_click(ri, ot))
-                widget.configure(cursor="hand2")
-            except:
-                pass
-            for child in widget.winfo_children():
-                bind_click(child)
+        return {'frame': slot_frame, 'container': slot_container, 'tile': tile,
+                'symbol': symbol, 'meta': meta, 'dimmed': dimmed, 'state': None}
+    
+    def _refresh_object_slot(self, slot, room, room_idx, obj_type):
+        """Restyle a slot for its object and selection; no-op when neither changed"""
+        obj = room.get_slot(obj_type)
+        is_slot_selected = (room_idx == self.selected_room and obj_type == self.selected_slot)
+        state = (obj, is_slot_selected)
+        if slot['state'] == state:
+            return
+        slot['state'] = state
 
-        bind_click(slot_frame)
+        slot_bg = self.THEME['accent_gold'] if is_slot_selected else '#FFFFFF'
+        inner_pad = 3 if is_slot_selected else 1
+        slot['container'].configure(bg=slot_bg, padx=inner_pad, pady=inner_pad)
 
-        return slot_frame
+        if obj:
+            color, style = obj.color, obj.style
+            tile_bg = color.hex_color if not slot['dimmed'] else '#CFCBC4'
+            slot['tile'].configure(bg=tile_bg)
+            slot['symbol'].configure(text=style.symbol, bg=tile_bg, fg=contrast_text_color(tile_bg))
+            slot['meta'].configure(text=_SLOT_META_TEXT[style, color], style="SlotMeta.TLabel")
+        else:
+            slot['tile'].configure(bg='#F0ECE5')
+            slot['symbol'].configure(text="+", bg='#F0ECE5', fg='#AFA8A0')
+            slot['meta'].configure(text="Empty", style="Empty.SlotMeta.TLabel")
     
     def on_slot_click(self, room_idx, obj_type):
         """Handle slot click - select and optionally open picker"""
@@ -1326,52 +2008,59 @@ class DecorumGame:
     
     def show_slot_options_dialog(self, room_idx, obj_type, obj):
         """Show options for a filled slot"""
-        dialog = tk.Toplevel(self.root)
+        parts = self._dialog("slot_options", self._build_slot_options_dialog)
+        parts['target'] = (room_idx, obj_type)
+        parts['emoji'].configure(text=obj_type.emoji)
+        parts['object'].configure(text=f"{obj.style.symbol} {obj.color.name_str} {obj.style.name_str}",
+                                  fg=obj.color.dark_hex)
+        parts['type'].configure(text=obj_type.name_str)
+        self._show_dialog(parts['dialog'], 380, 320)
+    
+    def _build_slot_options_dialog(self, dialog):
+        T = self.THEME
         dialog.title("Object Options")
-        dialog.geometry("380x320")
-        dialog.configure(bg=self.THEME['bg'])
-        dialog.transient(self.root)
-        dialog.grab_set()
-        self.center_window(dialog, 380, 320)
         
         # Object info
-        tk.Label(dialog, text=obj_type.emoji, font=("Segoe UI", 48),
-                bg=self.THEME['bg']).pack(pady=15)
-        tk.Label(dialog, text=f"{obj.style.symbol} {obj.color.name_str} {obj.style.name_str}",
-                font=("Georgia", 16, "bold"), bg=self.THEME['bg'],
-                fg=obj.color.dark_hex).pack()
-        tk.Label(dialog, text=obj_type.name_str, font=("Segoe UI", 12),
-                bg=self.THEME['bg'], fg=self.THEME['text_medium']).pack(pady=(5,20))
+        emoji = tk.Label(dialog, font=("Segoe UI", 48), bg=T['bg'])
+        emoji.pack(pady=15)
+        obj_label = tk.Label(dialog, font=("Georgia", 16, "bold"), bg=T['bg'])
+        obj_label.pack()
+        type_label = tk.Label(dialog, font=("Segoe UI", 12), bg=T['bg'], fg=T['text_medium'])
+        type_label.pack(pady=(5,20))
         
         # Options
-        options_frame = tk.Frame(dialog, bg=self.THEME['bg'])
+        options_frame = tk.Frame(dialog, bg=T['bg'])
         options_frame.pack(fill=tk.X, padx=40)
         
         def do_swap():
-            dialog.destroy()
+            _, obj_type = parts['target']
+            self._hide_dialog(dialog)
             self.show_object_picker(self.do_swap, obj_type)
         
         def do_remove():
-            prev_obj = self.house.rooms[room_idx].get_slot(obj_type)
-            self.house.rooms[room_idx].set_slot(obj_type, None)
+            room_idx, obj_type = parts['target']
+            prev_obj = self.house.remove(room_idx, obj_type)
             self.last_action = ("set_slot", room_idx, obj_type, prev_obj)
             self.action_taken_this_turn = True
             self.selected_room = None
             self.selected_slot = None
-            dialog.destroy()
-            self.build_game_ui()
+            self._hide_dialog(dialog)
+            self.request_redraw()
         
         StyledButton(options_frame, "Swap with Different Object", do_swap,
-                    bg_color=self.THEME['accent_lavender'], hover_color="#9575CD",
+                    bg_color=T['accent_lavender'], hover_color="#9575CD",
                     fg_color="white", icon="🔄", font_size=11, padx=15, pady=10).pack(fill=tk.X, pady=5)
         
         StyledButton(options_frame, "Remove Object", do_remove,
-                    bg_color=self.THEME['error'], hover_color="#EF5350",
+                    bg_color=T['error'], hover_color="#EF5350",
                     fg_color="white", icon="🗑️", font_size=11, padx=15, pady=10).pack(fill=tk.X, pady=5)
         
-        StyledButton(options_frame, "Cancel", dialog.destroy,
-                    bg_color=self.THEME['bg_alt'], hover_color=self.THEME['border'],
-                    fg_color=self.THEME['text_dark'], font_size=10, padx=15, pady=8).pack(fill=tk.X, pady=10)
+        StyledButton(options_frame, "Cancel", lambda: self._hide_dialog(dialog),
+                    bg_color=T['bg_alt'], hover_color=T['border'],
+                    fg_color=T['text_dark'], font_size=10, padx=15, pady=8).pack(fill=tk.X, pady=10)
+        
+        parts = {'emoji': emoji, 'object': obj_label, 'type': type_label, 'target': None}
+        return parts
     
     def select_room(self, idx):
         # Toggle selection if clicking same room
@@ -1398,13 +2087,13 @@ class DecorumGame:
         action = self.last_action[0]
         if action == "set_slot":
             _, room_idx, obj_type, prev_obj = self.last_action
-            self.house.rooms[room_idx].set_slot(obj_type, prev_obj)
+            self.house.place(room_idx, obj_type, prev_obj)
         elif action == "paint":
             _, room_idx, prev_color = self.last_action
-            self.house.rooms[room_idx].wall_color = prev_color
+            self.house.paint(room_idx, prev_color)
         self.last_action = None
         self.action_taken_this_turn = False
-        self.build_game_ui()
+        self.request_redraw()
     
     def select_slot(self, room_idx, obj_type):
         if self.action_taken_this_turn:
@@ -1415,79 +2104,61 @@ class DecorumGame:
 
     def update_selection_visuals(self):
         """Update selection highlights without full re-render"""
-        for i, border in self.room_borders.items():
-            if i == self.selected_room:
-                border.configure(bg=self.house.rooms[i].wall_color.hex_color)
-            else:
-                border.configure(bg=self.house.rooms[i].wall_color.hex_color)
-        if self.selection_labels.get("empty") and self.selected_room is not None:
-            self.selection_labels["empty"].destroy()
-        if self.selection_labels.get("room") and self.selected_room is not None:
-            room = self.house.rooms[self.selected_room]
-            self.selection_labels["room"].configure(text=room.name)
-        if self.selection_labels.get("wall") and self.selected_room is not None:
-            room = self.house.rooms[self.selected_room]
-            self.selection_labels["wall"].configure(text=f"🎨{room.wall_color.name_str}")
-        if self.selection_labels.get("slot"):
-            if self.selected_room is not None and self.selected_slot is not None:
-                room = self.house.rooms[self.selected_room]
-                obj = room.get_slot(self.selected_slot)
-                slot_text = f"{self.selected_slot.emoji} {self.selected_slot.name_str}"
-                if obj:
-                    slot_text += f" • {obj.color.name_str} {obj.style.name_str}"
-                self.selection_labels["slot"].configure(text=slot_text)
+        # Only the previously and newly selected rooms can look different
+        for idx in {self._shown_selected_room, self.selected_room} - {None}:
+            self._refresh_room_card(idx)
+        self._shown_selected_room = self.selected_room
+        self._update_selection_info()
     
     def heart_to_heart(self):
         """Use a heart-to-heart for open discussion"""
+        T = self.THEME
         if self.heart_to_heart_used >= self.max_heart_to_heart:
             self.show_fancy_message("No Heart-to-Hearts Left", 
                 "You've used all 3 heart-to-hearts!\nCommunicate through reactions only.", "warning")
             return
         
+        self._init_dialog_styles()
         dialog = tk.Toplevel(self.root)
         dialog.title("Heart-to-Heart")
-        dialog.geometry("480x380")
-        dialog.configure(bg=self.THEME['bg'])
+        dialog.configure(bg=T['bg'])
         dialog.transient(self.root)
         dialog.grab_set()
         self.center_window(dialog, 480, 380)
         
-        tk.Label(dialog, text="💕", font=("Segoe UI", 56),
-                bg=self.THEME['bg']).pack(pady=20)
-        tk.Label(dialog, text="Heart-to-Heart", font=("Georgia", 22, "bold"),
-                bg=self.THEME['bg'], fg=self.THEME['accent_rose']).pack()
+        ttk.Label(dialog, text="💕", style="Icon.Dialog.TLabel").pack(pady=20)
+        ttk.Label(dialog, text="Heart-to-Heart", style="Title.Dialog.TLabel",
+                  foreground=T['accent_rose']).pack()
         
         remaining = self.max_heart_to_heart - self.heart_to_heart_used - 1
-        tk.Label(dialog, text=f"({remaining} remaining after this)",
-                font=("Segoe UI", 11), bg=self.THEME['bg'],
-                fg=self.THEME['text_medium']).pack(pady=5)
+        ttk.Label(dialog, text=f"({remaining} remaining after this)", style="Dialog.TLabel",
+                  font=self._font("Segoe UI", 11)).pack(pady=5)
         
-        info_frame = tk.Frame(dialog, bg=self.THEME['bg_alt'], padx=30, pady=20)
+        info_frame = tk.Frame(dialog, bg=T['bg_alt'], padx=30, pady=20)
         info_frame.pack(fill=tk.X, padx=40, pady=20)
         
-        tk.Label(info_frame, text="During a Heart-to-Heart, both players can\n"
-                                  "openly discuss their conditions and strategy.\n\n"
-                                  "Take your time to talk it out! ☕",
-                font=("Segoe UI", 12), bg=self.THEME['bg_alt'],
-                fg=self.THEME['text_dark'], justify='center').pack()
+        ttk.Label(info_frame, text="During a Heart-to-Heart, both players can\n"
+                                   "openly discuss their conditions and strategy.\n\n"
+                                   "Take your time to talk it out! ☕",
+                  style="Note.Dialog.TLabel").pack()
         
         def confirm():
             self.heart_to_heart_used += 1
             dialog.destroy()
             self.show_fancy_message("Heart-to-Heart Started! 💕",
                 "Discuss openly with your partner.\nClick OK when you're done.", "info")
-            self.build_game_ui()
+            self.request_redraw()
         
-        btns = tk.Frame(dialog, bg=self.THEME['bg'])
+        btns = tk.Frame(dialog, bg=T['bg'])
         btns.pack(pady=15)
         
         StyledButton(btns, "Start Discussion", confirm,
-                    bg_color=self.THEME['accent_rose'], hover_color="#EC407A",
+                    bg_color=T['accent_rose'], hover_color="#EC407A",
                     fg_color="white", icon="💬", font_size=12, padx=20, pady=10).pack(side=tk.LEFT, padx=10)
         
         StyledButton(btns, "Cancel", dialog.destroy,
-                    bg_color=self.THEME['bg_alt'], hover_color=self.THEME['border'],
-                    fg_color=self.THEME['text_dark'], font_size=11, padx=20, pady=10).pack(side=tk.LEFT, padx=10)
+                    bg_color=T['bg_alt'], hover_color=T['border'],
+                    fg_color=T['text_dark'], font_size=11, padx=20, pady=10).pack(side=tk.LEFT, padx=10)
     
     def action_add(self):
         if self.action_taken_this_turn:
@@ -1504,14 +2175,12 @@ class DecorumGame:
     
     def do_add(self, obj):
         if obj and self.selected_room is not None:
-            room = self.house.rooms[self.selected_room]
-            prev_obj = room.get_slot(obj.obj_type)
-            room.set_slot(obj.obj_type, obj)
+            prev_obj = self.house.place(self.selected_room, obj.obj_type, obj)
             self.last_action = ("set_slot", self.selected_room, obj.obj_type, prev_obj)
             self.action_taken_this_turn = True
             self.selected_room = None
             self.selected_slot = None
-            self.build_game_ui()
+            self.request_redraw()
     
     def action_remove(self):
         if self.action_taken_this_turn:
@@ -1524,13 +2193,12 @@ class DecorumGame:
         if room.is_slot_empty(self.selected_slot):
             self.show_fancy_message("Empty Slot", "This slot is already empty!", "info")
             return
-        prev_obj = room.get_slot(self.selected_slot)
-        room.set_slot(self.selected_slot, None)
+        prev_obj = self.house.remove(self.selected_room, self.selected_slot)
         self.last_action = ("set_slot", self.selected_room, self.selected_slot, prev_obj)
         self.action_taken_this_turn = True
         self.selected_room = None
         self.selected_slot = None
-        self.build_game_ui()
+        self.request_redraw()
     
     def action_swap(self):
         if self.action_taken_this_turn:
@@ -1547,14 +2215,12 @@ class DecorumGame:
     
     def do_swap(self, obj):
         if obj and self.selected_room is not None:
-            room = self.house.rooms[self.selected_room]
-            prev_obj = room.get_slot(obj.obj_type)
-            room.set_slot(obj.obj_type, obj)
+            prev_obj = self.house.place(self.selected_room, obj.obj_type, obj)
             self.last_action = ("set_slot", self.selected_room, obj.obj_type, prev_obj)
             self.action_taken_this_turn = True
             self.selected_room = None
             self.selected_slot = None
-            self.build_game_ui()
+            self.request_redraw()
     
     def action_paint(self):
         if self.action_taken_this_turn:
@@ -1565,269 +2231,329 @@ class DecorumGame:
             return
         
         room = self.house.rooms[self.selected_room]
-        room_style = self.room_colors[self.selected_room]
-        
-        dialog = tk.Toplevel(self.root)
+        parts = self._dialog("paint", self._build_paint_dialog)
+        parts['icon'].configure(fg=room.wall_color.hex_color)
+        parts['title'].configure(text=f"Paint {room.name}")
+        parts['current'].configure(text=f"Current: {room.wall_color.name_str}")
+        self._show_dialog(parts['dialog'], 520, 360)
+    
+    def _build_paint_dialog(self, dialog):
+        T = self.THEME
         dialog.title("Paint Walls")
-        dialog.geometry("520x360")
-        dialog.configure(bg=self.THEME['bg'])
-        dialog.transient(self.root)
-        dialog.grab_set()
-        self.center_window(dialog, 520, 360)
         
-        tk.Label(dialog, text="🎨", font=("Segoe UI", 52),
-                bg=self.THEME['bg'], fg=room.wall_color.hex_color).pack(pady=20)
+        icon = tk.Label(dialog, text="🎨", font=("Segoe UI", 52), bg=T['bg'])
+        icon.pack(pady=20)
         
-        tk.Label(dialog, text=f"Paint {room.name}", font=("Georgia", 20, "bold"),
-                bg=self.THEME['bg'], fg=self.THEME['text_dark']).pack()
+        title = tk.Label(dialog, font=("Georgia", 20, "bold"), bg=T['bg'], fg=T['text_dark'])
+        title.pack()
         
-        tk.Label(dialog, text=f"Current: {room.wall_color.name_str}",
-                font=("Segoe UI", 12), bg=self.THEME['bg'],
-                fg=self.THEME['text_medium']).pack(pady=10)
+        current = tk.Label(dialog, font=("Segoe UI", 12), bg=T['bg'], fg=T['text_medium'])
+        current.pack(pady=10)
         
         tk.Label(dialog, text="Choose new wall color:", font=("Segoe UI", 11),
-                bg=self.THEME['bg'], fg=self.THEME['text_light']).pack(pady=(10,6))
+                bg=T['bg'], fg=T['text_light']).pack(pady=(10,6))
         
-        colors_frame = tk.Frame(dialog, bg=self.THEME['bg'])
+        colors_frame = tk.Frame(dialog, bg=T['bg'])
         colors_frame.pack(pady=10)
         
-        for color in Color:
+        for color in _ALL_COLORS:
             card = tk.Frame(colors_frame, bg="#FFFFFF", padx=8, pady=8,
-                           highlightbackground=self.THEME['border'], highlightthickness=1)
+                           highlightbackground=T['border'], highlightthickness=1)
             card.pack(side=tk.LEFT, padx=8)
             
             swatch = tk.Frame(card, bg=color.hex_color, width=64, height=64)
             swatch.pack()
             swatch.pack_propagate(False)
             
-            tk.Label(card, text=color.name_str, font=("Segoe UI", 10, "bold"),
-                    bg="#FFFFFF", fg=self.THEME['text_dark']).pack(pady=(6,0))
+            name = tk.Label(card, text=color.name_str, font=("Segoe UI", 10, "bold"),
+                            bg="#FFFFFF", fg=T['text_dark'])
+            name.pack(pady=(6,0))
             
             select_btn = tk.Button(card, text="Select", font=("Segoe UI", 9, "bold"),
                                   bg=color.hex_color, fg='white',
                                   relief=tk.FLAT, cursor='hand2',
                                   activebackground=color.dark_hex,
-                                  command=lambda c=color: self.do_paint(c, dialog))
+                                  command=lambda c=color: self.do_paint(c))
             select_btn.pack(pady=(6,0), ipadx=6, ipady=2)
             
             # Make entire card clickable
-            def bind_pick(widget):
-                widget.bind("<Button-1>", lambda e, c=color: self.do_paint(c, dialog))
-                for child in widget.winfo_children():
-                    bind_pick(child)
-            bind_pick(card)
+            tag = f"paint-{color.name}"
+            self.root.bind_class(tag, "<Button-1>", lambda e, c=color: self.do_paint(c))
+            for w in (card, swatch, name):
+                w.bindtags((tag,) + w.bindtags())
             
-            select_btn.bind("<Enter>", lambda e, b=select_btn, c=color: b.configure(bg=c.dark_hex))
-            select_btn.bind("<Leave>", lambda e, b=select_btn, c=color: b.configure(bg=c.hex_color))
+            bind_hover(select_btn, color.hex_color, color.dark_hex)
+        
+        StyledButton(dialog, "Cancel", lambda: self._hide_dialog(dialog),
+                    bg_color=T['bg_alt'], hover_color=T['border'],
+                    fg_color=T['text_dark'], font_size=10, padx=20, pady=8).pack(pady=20)
         
-        StyledButton(dialog, "Cancel", dialog.destroy,
-                    bg_color=self.THEME['bg_alt'], hover_color=self.THEME['border'],
-                    fg_color=self.THEME['text_dark'], font_size=10, padx=20, pady=8).pack(pady=20)
+        return {'icon': icon, 'title': title, 'current': current}
     
-    def do_paint(self, color, dialog):
+    def do_paint(self, color):
         if self.selected_room is not None:
-            prev_color = self.house.rooms[self.selected_room].wall_color
-            self.house.rooms[self.selected_room].wall_color = color
+            prev_color = self.house.paint(self.selected_room, color)
             self.last_action = ("paint", self.selected_room, prev_color)
             self.action_taken_this_turn = True
             self.selected_room = None
             self.selected_slot = None
-        dialog.destroy()
-        self.build_game_ui()
+        self._hide_dialog(self._dialogs["paint"]['dialog'])
+        self.request_redraw()
     
     def show_object_picker(self, callback, filter_type):
-        dialog = tk.Toplevel(self.root)
+        parts = self._dialog("picker", self._build_object_picker)
+        parts['callback'] = callback
+        
+        # The 4 valid options for this object type (one per style); the cards
+        # still show them if the picker was last opened for the same type
+        objects = OBJECTS_BY_TYPE[filter_type]
+        if parts['objects'] is not objects:
+            parts['objects'] = objects
+            self._fill_object_picker(parts, filter_type)
+        
+        self._show_dialog(parts['dialog'], 520, 560)
+    
+    def _fill_object_picker(self, parts, filter_type):
+        parts['title'].configure(text=f"{filter_type.emoji}  Select {filter_type.name_str}")
+        text_dark = self.THEME['text_dark']
+        text_medium = self.THEME['text_medium']
+        for card, obj in zip(parts['cards'], parts['objects']):
+            color, style = obj.color, obj.style
+            card_bg = color.light_hex
+            card['card'].configure(bg=card_bg, highlightbackground=color.dark_hex)
+            card['symbol'].configure(text=style.symbol, bg=card_bg, fg=style.color)
+            card['style'].configure(text=style.name_str, bg=card_bg, fg=text_dark)
+            card['meta'].configure(text=f"{color.name_str} {filter_type.name_str}",
+                                   bg=card_bg, fg=text_medium)
+            button = card['button']
+            button.bg_color = color.hex_color
+            button.hover_color = color.dark_hex
+            button.configure(bg=color.hex_color, activebackground=color.dark_hex)
+    
+    def _build_object_picker(self, dialog):
+        T = self.THEME
         dialog.title("Select Object")
-        dialog.geometry("520x560")
-        dialog.configure(bg=self.THEME['bg'])
-        dialog.transient(self.root)
-        dialog.grab_set()
-        self.center_window(dialog, 520, 560)
         
-        tk.Label(dialog, text=f"{filter_type.emoji}  Select {filter_type.name_str}", 
-                font=("Georgia", 20, "bold"),
-                bg=self.THEME['bg'], fg=self.THEME['text_dark']).pack(pady=18)
+        title = tk.Label(dialog, font=("Georgia", 20, "bold"), bg=T['bg'], fg=T['text_dark'])
+        title.pack(pady=18)
         
         tk.Label(dialog, text="Valid combinations only (rulebook page 6)",
-                font=("Segoe UI", 10), bg=self.THEME['bg'],
-                fg=self.THEME['text_medium']).pack(pady=(0,10))
+                font=("Segoe UI", 10), bg=T['bg'],
+                fg=T['text_medium']).pack(pady=(0,10))
         
-        options_frame = tk.Frame(dialog, bg=self.THEME['bg'])
+        options_frame = tk.Frame(dialog, bg=T['bg'])
         options_frame.pack(expand=True, fill=tk.BOTH, padx=25, pady=10)
         
-        # Build 4 valid options for this object type (one per style)
-        objects = [GameObject(filter_type, VALID_OBJECTS_MAP[filter_type][style], style) for style in Style]
-        
-        def pick(obj):
-            callback(obj)
-            dialog.destroy()
+        def pick(idx):
+            parts['callback'](parts['objects'][idx])
+            self._hide_dialog(dialog)
         
-        for idx, obj in enumerate(objects):
+        cards = []
+        for idx in range(len(_ALL_STYLES)):
             row, col = divmod(idx, 2)
-            card_bg = obj.color.light_hex
             
-            card = tk.Frame(options_frame, bg=card_bg,
-                           highlightbackground=obj.color.dark_hex, highlightthickness=2)
+            card = tk.Frame(options_frame, highlightthickness=2)
             card.grid(row=row, column=col, padx=12, pady=12, sticky="nsew")
             
-            tk.Label(card, text=obj.style.symbol, font=("Segoe UI", 20),
-                    bg=card_bg, fg=obj.style.color).pack(pady=(12,0))
+            symbol = tk.Label(card, font=("Segoe UI", 20))
+            symbol.pack(pady=(12,0))
             
-            tk.Label(card, text=obj.style.name_str, font=("Georgia", 14, "bold"),
-                    bg=card_bg, fg=self.THEME['text_dark']).pack()
+            style = tk.Label(card, font=("Georgia", 14, "bold"))
+            style.pack()
             
-            tk.Label(card, text=f"{obj.color.name_str} {filter_type.name_str}",
-                    font=("Segoe UI", 10), bg=card_bg, fg=self.THEME['text_medium']).pack(pady=(0,8))
+            meta = tk.Label(card, font=("Segoe UI", 10))
+            meta.pack(pady=(0,8))
             
             select_btn = tk.Button(card, text="Select", font=("Segoe UI", 10, "bold"),
-                                  bg=obj.color.hex_color, fg='white',
-                                  relief=tk.FLAT, cursor='hand2',
-                                  activebackground=obj.color.dark_hex,
-                                  command=lambda o=obj: pick(o))
+                                  fg='white', relief=tk.FLAT, cursor="hand2",
+                                  command=lambda i=idx: pick(i))
             select_btn.pack(pady=(0,12), ipadx=10, ipady=4)
+            # Colors are filled in per object type by _fill_object_picker
+            bind_hover(select_btn, None, None)
             
-            select_btn.bind("<Enter>", lambda e, b=select_btn, c=obj.color: b.configure(bg=c.dark_hex))
-            select_btn.bind("<Leave>", lambda e, b=select_btn, c=obj.color: b.configure(bg=c.hex_color))
-            
-            for w in [card] + list(card.winfo_children()):
-                w.bind("<Button-1>", lambda e, o=obj: pick(o))
+            tag = f"picker-{idx}"
+            self.root.bind_class(tag, "<Button-1>", lambda e, i=idx: pick(i))
+            for w in (card, symbol, style, meta):
+                w.bindtags((tag,) + w.bindtags())
                 w.configure(cursor="hand2")
+            
+            cards.append({'card': card, 'symbol': symbol, 'style': style,
+                          'meta': meta, 'button': select_btn})
         
         options_frame.grid_columnconfigure(0, weight=1)
         options_frame.grid_columnconfigure(1, weight=1)
         
-        StyledButton(dialog, "Cancel", dialog.destroy,
-                    bg_color=self.THEME['bg_alt'], hover_color=self.THEME['border'],
-                    fg_color=self.THEME['text_dark'], font_size=10, padx=20, pady=8).pack(pady=10)
+        StyledButton(dialog, "Cancel", lambda: self._hide_dialog(dialog),
+                    bg_color=T['bg_alt'], hover_color=T['border'],
+                    fg_color=T['text_dark'], font_size=10, padx=20, pady=8).pack(pady=10)
+        
+        parts = {'title': title, 'cards': cards, 'objects': None, 'callback': None}
+        return parts
     
     def react(self, reaction):
         # Store reaction for display
         self.last_reactions[self.current_player] = reaction
-        # Update reaction label if present, otherwise rebuild minimal UI
+        # Update reaction label if shown, otherwise refresh the UI
         react_emoji = {"happy": "😊", "neutral": "😐", "unhappy": "😠"}
-        if self.reaction_label:
-            self.reaction_label.configure(text=f"Partner reaction: {react_emoji.get(reaction, '')}")
+        if self.reaction_label.winfo_manager():
+            self._apply(self.reaction_label, text=f"Partner reaction: {react_emoji.get(reaction, '')}")
         else:
-            self.build_game_ui()
+            self.request_redraw()
     
     def show_my_conditions(self):
-        dialog = tk.Toplevel(self.root)
-        dialog.title("My Conditions")
-        dialog.geometry("480x450")
-        dialog.configure(bg=self.THEME['bg'])
-        dialog.transient(self.root)
-        dialog.grab_set()
-        self.center_window(dialog, 480, 450)
+        T = self.THEME
+        parts = self._dialog("my_conditions", self._build_my_conditions)
+        cp = self.current_player
+        player_color = self.player_colors[cp]
         
-        player_color = self.player_colors[self.current_player]
+        parts['lock'].configure(fg=player_color)
+        parts['title'].configure(text=f"{self.player_names[cp]}'s Conditions", fg=player_color)
         
-        tk.Label(dialog, text="🔒", font=("Segoe UI", 42),
-                bg=self.THEME['bg'], fg=player_color).pack(pady=20)
+        results = self.condition_results(cp)
+        self.fill_condition_list(parts['conditions'], self.player_conditions[cp], results)
         
-        tk.Label(dialog, text=f"{self.player_names[self.current_player]}'s Conditions",
-                font=("Georgia", 18, "bold"),
-                bg=self.THEME['bg'], fg=player_color).pack()
+        # Status summary
+        if all(results):
+            parts['status'].configure(text="🎉 All YOUR conditions are met!", fg=T['success'])
+        else:
+            parts['status'].configure(text="⏳ Some conditions still need work", fg=T['warning'])
         
-        cond_frame = tk.Frame(dialog, bg=self.THEME['panel'], padx=30, pady=25,
-                             highlightbackground=self.THEME['border'], highlightthickness=1)
-        cond_frame.pack(fill=tk.X, padx=35, pady=20)
+        parts['close'].restyle("Close", player_color, self.player_dark_colors[cp])
+        self._show_dialog(parts['dialog'], 480, 450)
+    
+    def _build_my_conditions(self, dialog):
+        T = self.THEME
+        dialog.title("My Conditions")
         
-        all_met = True
-        for c in self.player_conditions[self.current_player]:
-            met = c.check(self.house)
-            if not met: all_met = False
-            
-            row = tk.Frame(cond_frame, bg=self.THEME['panel'])
-            row.pack(fill=tk.X, pady=5)
-            
-            status_color = self.THEME['success'] if met else self.THEME['error']
-            status_icon = "✅" if met else "❌"
-            
-            tk.Label(row, text=status_icon, font=("Segoe UI", 14),
-                    bg=self.THEME['panel'], fg=status_color).pack(side=tk.LEFT)
-            tk.Label(row, text=str(c), font=("Segoe UI", 11),
-                    bg=self.THEME['panel'], fg=self.THEME['text_dark']).pack(side=tk.LEFT, padx=12)
+        lock = tk.Label(dialog, text="🔒", font=self._font("Segoe UI", 42), bg=T['bg'])
+        lock.pack(pady=20)
         
-        # Status summary
-        if all_met:
-            status_text = "🎉 All YOUR conditions are met!"
-            status_color = self.THEME['success']
-        else:
-            status_text = "⏳ Some conditions still need work"
-            status_color = self.THEME['warning']
+        title = tk.Label(dialog, font=("Georgia", 18, "bold"), bg=T['bg'])
+        title.pack()
+        
+        cond_frame = tk.Frame(dialog, bg=T['panel'], padx=30, pady=25,
+                             highlightbackground=T['border'], highlightthickness=1)
+        cond_frame.pack(fill=tk.X, padx=35, pady=20)
+        conditions = self.draw_condition_list(cond_frame, [], [], spacing=5,
+                                              icon_font=("Segoe UI", 14), text_x=34,
+                                              text_font=("Segoe UI", 11),
+                                              text_fg=T['text_dark'])
+        conditions.pack(fill=tk.X)
+        
+        status = tk.Label(dialog, font=("Segoe UI", 12, "bold"), bg=T['bg'])
+        status.pack(pady=15)
         
-        tk.Label(dialog, text=status_text, font=("Segoe UI", 12, "bold"),
-                bg=self.THEME['bg'], fg=status_color).pack(pady=15)
+        close = StyledButton(dialog, "Close", lambda: self._hide_dialog(dialog),
+                             fg_color="white", font_size=11, padx=25, pady=8)
+        close.pack(pady=5)
         
-        StyledButton(dialog, "Close", dialog.destroy,
-                    bg_color=player_color, hover_color=self.player_dark_colors[self.current_player],
-                    fg_color="white", font_size=11, padx=25, pady=8).pack(pady=5)
+        return {'lock': lock, 'title': title, 'conditions': conditions,
+                'status': status, 'close': close}
+    
+    def condition_results(self, player_idx):
+        """Whether each of a player's conditions is met, read from the house's tracked results"""
+        is_satisfied = self.house.is_satisfied
+        return [is_satisfied(c) for c in self.player_conditions[player_idx]]
+    
+    def draw_condition_list(self, parent, conditions, results, spacing,
+                            icon_font, text_x, text_font, text_fg=None):
+        """A read-only Text listing conditions with a ✅/❌ each, one line per row.
+        
+        The condition text is drawn in text_fg, or in the status color when
+        it is None; text_x is where it starts, in pixels.
+        """
+        T = self.THEME
+        txt = tk.Text(parent, bg=T['panel'], bd=0, highlightthickness=0, width=1,
+                      font=icon_font, wrap='word', cursor='arrow',
+                      spacing1=spacing, spacing3=spacing, tabs=(text_x,))
+        for status, color in (('ok', T['success']), ('bad', T['error'])):
+            txt.tag_configure(status, font=icon_font, foreground=color)
+            txt.tag_configure(status + '_text', font=text_font,
+                              foreground=text_fg or color, lmargin2=text_x)
+        self.fill_condition_list(txt, conditions, results)
+        return txt
+    
+    @staticmethod
+    def fill_condition_list(txt, conditions, results):
+        """Replace the rows of a draw_condition_list() Text"""
+        # Text heights count lines of the widget font; the icons set the line
+        # height, and the spacing above and below each row adds to it
+        linespace = int(txt.tk.call('font', 'metrics', txt.cget('font'), '-linespace'))
+        n = len(conditions)
+        extra = -(-2 * int(txt.cget('spacing1')) * n // linespace)
+        txt.configure(state='normal', height=n + extra)
+        txt.delete('1.0', 'end')
+        for i, (cond, met) in enumerate(zip(conditions, results)):
+            status = 'ok' if met else 'bad'
+            txt.insert('end', "✅\t" if met else "❌\t", status,
+                       str(cond) if i == n - 1 else f"{cond}\n", status + '_text')
+        txt.configure(state='disabled')
     
     def check_win(self):
-        dialog = tk.Toplevel(self.root)
-        dialog.title("Condition Check")
-        dialog.geometry("560x520")
-        dialog.configure(bg=self.THEME['bg'])
-        dialog.transient(self.root)
-        dialog.grab_set()
-        self.center_window(dialog, 560, 520)
+        T = self.THEME
+        parts = self._dialog("check_win", self._build_check_win)
 
         player_idx = self.current_player
         player_name = self.player_names[player_idx]
         player_color = self.player_colors[player_idx]
         player_emoji = "🔴" if player_idx == 0 else "🔵"
         conditions = self.player_conditions[player_idx]
-        results = [c.check(self.house) for c in conditions]
-        met_count = sum(1 for met in results if met)
+        results = self.condition_results(player_idx)
+        met_count = results.count(True)
         total_count = len(conditions)
         all_met = (total_count > 0 and met_count == total_count)
 
-        tk.Label(dialog, text=f"{player_emoji} {player_name}", font=("Georgia", 22, "bold"),
-                bg=self.THEME['bg'], fg=player_color).pack(pady=(20, 6))
+        parts['player'].configure(text=f"{player_emoji} {player_name}", fg=player_color)
+        parts['actions'].configure(text=f"Actions taken: {self.turn_count}")
 
-        tk.Label(dialog, text=f"Actions taken: {self.turn_count}",
-                font=("Segoe UI", 10), bg=self.THEME['bg'],
-                fg=self.THEME['text_medium']).pack(pady=(0, 10))
+        icon, color_key, status_text = _WIN_STATUS[total_count > 0, all_met]
+        status_text = status_text.format(met=met_count, total=total_count)
+        status_color = T[color_key]
+        parts['icon'].configure(text=icon, fg=status_color)
+        parts['status'].configure(text=status_text, fg=status_color)
 
         if total_count == 0:
-            status_text = "No conditions set for current player."
-            status_color = self.THEME['warning']
-            icon = "📋"
-        elif all_met:
-            status_text = "All your conditions are met!"
-            status_color = self.THEME['success']
-            icon = "✅"
+            self._repack(parts['frame'], [(parts['empty'], dict(anchor='w'))])
         else:
-            status_text = f"{met_count}/{total_count} conditions met"
-            status_color = self.THEME['warning']
-            icon = "⏳"
+            self.fill_condition_list(parts['conditions'], conditions, results)
+            self._repack(parts['frame'], [(parts['conditions'], dict(fill=tk.X))])
+
+        parts['close'].restyle("Close", player_color, self.player_dark_colors[player_idx])
+        self._show_dialog(parts['dialog'], 560, 520)
+
+    def _build_check_win(self, dialog):
+        T = self.THEME
+        dialog.title("Condition Check")
+
+        player = tk.Label(dialog, font=("Georgia", 22, "bold"), bg=T['bg'])
+        player.pack(pady=(20, 6))
+
+        actions = tk.Label(dialog, font=("Segoe UI", 10), bg=T['bg'], fg=T['text_medium'])
+        actions.pack(pady=(0, 10))
 
-        tk.Label(dialog, text=icon, font=("Segoe UI", 34),
-                bg=self.THEME['bg'], fg=status_color).pack(pady=(4, 0))
-        tk.Label(dialog, text=status_text, font=("Segoe UI", 12, "bold"),
-                bg=self.THEME['bg'], fg=status_color).pack(pady=(4, 12))
+        icon = tk.Label(dialog, font=self._font("Segoe UI", 34), bg=T['bg'])
+        icon.pack(pady=(4, 0))
+        status = tk.Label(dialog, font=("Segoe UI", 12, "bold"), bg=T['bg'])
+        status.pack(pady=(4, 12))
 
-        player_frame = tk.Frame(dialog, bg=self.THEME['panel'], padx=20, pady=14,
-                               highlightbackground=self.THEME['border'], highlightthickness=1)
+        player_frame = tk.Frame(dialog, bg=T['panel'], padx=20, pady=14,
+                               highlightbackground=T['border'], highlightthickness=1)
         player_frame.pack(fill=tk.BOTH, expand=True, padx=24, pady=8)
 
-        if total_count == 0:
-            tk.Label(player_frame, text="Add conditions in setup to use this check.",
-                    font=("Segoe UI", 10), bg=self.THEME['panel'],
-                    fg=self.THEME['text_light']).pack(anchor='w')
-        else:
-            for cond, met in zip(conditions, results):
-                row = tk.Frame(player_frame, bg=self.THEME['panel'])
-                row.pack(fill=tk.X, pady=3)
-                icon_text = "✅" if met else "❌"
-                color = self.THEME['success'] if met else self.THEME['error']
-                tk.Label(row, text=f"{icon_text}  {cond}", font=("Segoe UI", 10),
-                        bg=self.THEME['panel'], fg=color, anchor='w').pack(fill=tk.X)
+        # One of these is packed into player_frame per check
+        empty = tk.Label(player_frame, text="Add conditions in setup to use this check.",
+                         font=("Segoe UI", 10), bg=T['panel'], fg=T['text_light'])
+        conditions = self.draw_condition_list(player_frame, [], [], spacing=3,
+                                              icon_font=("Segoe UI", 10), text_x=26,
+                                              text_font=("Segoe UI", 10))
 
-        StyledButton(dialog, "Close", dialog.destroy,
-                    bg_color=player_color, hover_color=self.player_dark_colors[player_idx],
-                    fg_color="white", font_size=11, padx=25, pady=8).pack(pady=14)
+        close = StyledButton(dialog, "Close", lambda: self._hide_dialog(dialog),
+                             fg_color="white", font_size=11, padx=25, pady=8)
+        close.pack(pady=14)
 
+        return {'player': player, 'actions': actions, 'icon': icon, 'status': status,
+                'frame': player_frame, 'empty': empty, 'conditions': conditions,
+                'close': close}
     
     def end_turn(self):
         # No hard turn limit
@@ -1839,98 +2565,112 @@ class DecorumGame:
         self.action_taken_this_turn = False  # Reset for new turn
         self.last_action = None
         
-        # Show turn transition with animation
-        transition = tk.Toplevel(self.root)
-        transition.overrideredirect(True)
-        transition.geometry("450x220")
-        transition.configure(bg=self.player_colors[self.current_player])
-        self.center_window(transition, 450, 220)
-        transition.attributes('-topmost', True)
-        
-        player_emoji = "🔴" if self.current_player == 0 else "🔵"
-        
-        round_count = (self.turn_count // 2) + 1
-        tk.Label(transition, text=f"Round {round_count}",
-                font=("Segoe UI", 16), bg=self.player_colors[self.current_player],
-                fg='white').pack(pady=(35,10))
-        tk.Label(transition, text=f"{player_emoji} {self.player_names[self.current_player]}'s Turn",
-                font=("Georgia", 28, "bold"), bg=self.player_colors[self.current_player],
-                fg='white').pack()
-        
-        tk.Label(transition, text=f"(Actions taken: {self.turn_count})",
-                font=("Segoe UI", 11), bg=self.player_colors[self.current_player],
-                fg='white').pack(pady=15)
-        
-        self.root.after(1800, lambda: [transition.destroy(), self.build_game_ui()])
+        self.request_redraw()
+        self._show_turn_overlay()
+    
+    def _show_turn_overlay(self):
+        """Announce the new turn on a banner over the board that fades in, then hides"""
+        parts = self._turn_overlay
+        # build_game_ui() destroys every root child, the banner included
+        if parts is None or not parts['frame'].winfo_exists():
+            parts = self._turn_overlay = self._build_turn_overlay()
+        cp = self.current_player
+        player_emoji = "🔴" if cp == 0 else "🔵"
+        self._apply(parts['round'], text=f"Round {(self.turn_count // 2) + 1}")
+        self._apply(parts['player'], text=f"{player_emoji} {self.player_names[cp]}'s Turn")
+        self._apply(parts['actions'], text=f"(Actions taken: {self.turn_count})")
+        parts['frame'].place(relx=0.5, rely=0.5, anchor='center', width=450, height=220)
+        parts['frame'].lift()
+        
+        # A quick second end turn restarts the fade and the timer
+        for after_id in parts['after']:
+            self.root.after_cancel(after_id)
+        start, end = self.THEME['bg'], self.player_colors[cp]
+        steps = 6
+        parts['after'] = [self.root.after(50 * i, self._color_turn_overlay, parts,
+                                          _blend(start, end, i / steps))
+                          for i in range(steps + 1)]
+        parts['after'].append(self.root.after(1800, parts['frame'].place_forget))
+    
+    @staticmethod
+    def _color_turn_overlay(parts, color):
+        for w in parts['widgets']:
+            w.configure(bg=color)
+    
+    def _build_turn_overlay(self):
+        frame = tk.Frame(self.root)
+        round_label = tk.Label(frame, font=("Segoe UI", 16), fg='white')
+        round_label.pack(pady=(35,10))
+        player_label = tk.Label(frame, font=("Georgia", 28, "bold"), fg='white')
+        player_label.pack()
+        actions_label = tk.Label(frame, font=("Segoe UI", 11), fg='white')
+        actions_label.pack(pady=15)
+        return {'frame': frame, 'round': round_label, 'player': player_label,
+                'actions': actions_label, 'widgets': (frame, round_label, player_label, actions_label),
+                'after': []}
     
     def show_game_over(self):
         """Show game over screen when turns run out"""
+        T = self.THEME
+        self._init_dialog_styles()
         dialog = tk.Toplevel(self.root)
         dialog.title("Game Over")
-        dialog.geometry("550x500")
-        dialog.configure(bg=self.THEME['bg'])
+        dialog.configure(bg=T['bg'])
         dialog.transient(self.root)
         dialog.grab_set()
         self.center_window(dialog, 550, 500)
         
         # Check final status
-        all_met = all(c.check(self.house) for i in range(2) for c in self.player_conditions[i])
-        
-        if all_met:
-            tk.Label(dialog, text="🎉🏆🎉", font=("Segoe UI", 56),
-                    bg=self.THEME['bg'], fg=self.THEME['accent_gold']).pack(pady=25)
-            tk.Label(dialog, text="VICTORY!", font=("Georgia", 32, "bold"),
-                    bg=self.THEME['bg'], fg=self.THEME['accent_gold']).pack()
-            tk.Label(dialog, text="You completed all conditions!", font=("Segoe UI", 14),
-                    bg=self.THEME['bg'], fg=self.THEME['text_dark']).pack(pady=10)
-        else:
-            tk.Label(dialog, text="⏰", font=("Segoe UI", 56),
-                    bg=self.THEME['bg'], fg=self.THEME['error']).pack(pady=25)
-            tk.Label(dialog, text="Time's Up!", font=("Georgia", 32, "bold"),
-                    bg=self.THEME['bg'], fg=self.THEME['error']).pack()
-            tk.Label(dialog, text="You ran out of turns before completing all conditions.",
-                    font=("Segoe UI", 12), bg=self.THEME['bg'],
-                    fg=self.THEME['text_medium']).pack(pady=10)
+        is_satisfied = self.house.is_satisfied
+        met_count = sum(map(is_satisfied, self._all_conditions))
+        total_count = len(self._all_conditions)
+        all_met = (met_count == total_count)
+        
+        icon, banner, color_key, text, text_style = _GAME_OVER_STATUS[all_met]
+        ttk.Label(dialog, text=icon, style="Icon.Dialog.TLabel",
+                  foreground=T[color_key]).pack(pady=25)
+        ttk.Label(dialog, text=banner, style="Banner.Dialog.TLabel",
+                  foreground=T[color_key]).pack()
+        ttk.Label(dialog, text=text, style=text_style).pack(pady=10)
         
         # Final status
-        met_count = sum(1 for i in range(2) for c in self.player_conditions[i] if c.check(self.house))
-        total_count = sum(len(self.player_conditions[i]) for i in range(2))
-        
-        tk.Label(dialog, text=f"Final Score: {met_count}/{total_count} conditions met",
-                font=("Segoe UI", 14, "bold"), bg=self.THEME['bg'],
-                fg=self.THEME['text_dark']).pack(pady=20)
+        ttk.Label(dialog, text=f"Final Score: {met_count}/{total_count} conditions met",
+                  style="Dialog.TLabel", font=self._font("Segoe UI", 14, "bold"),
+                  foreground=T['text_dark']).pack(pady=20)
         
         StyledButton(dialog, "View Final Results", lambda: [dialog.destroy(), self.check_win()],
-                    bg_color=self.THEME['accent_lavender'], hover_color="#9575CD",
+                    bg_color=T['accent_lavender'], hover_color="#9575CD",
                     fg_color="white", font_size=12, padx=25, pady=12).pack(pady=10)
     
     def show_fancy_message(self, title, message, msg_type="info"):
-        dialog = tk.Toplevel(self.root)
-        dialog.title(title)
-        dialog.geometry("420x280")
-        dialog.configure(bg=self.THEME['bg'])
-        dialog.transient(self.root)
-        dialog.grab_set()
-        self.center_window(dialog, 420, 280)
-        
-        icons = {"info": "ℹ️", "warning": "⚠️", "error": "❌", "success": "✅"}
-        colors = {"info": self.THEME['accent_lavender'], "warning": self.THEME['warning'],
-                 "error": self.THEME['error'], "success": self.THEME['success']}
+        T = self.THEME
+        parts = self._dialog("message", self._build_fancy_message)
+        color = _MESSAGE_COLORS.get(msg_type)
+        parts['dialog'].title(title)
+        parts['icon'].configure(text=_MESSAGE_ICONS.get(msg_type, "ℹ️"),
+                                fg=T[color] if color else T['text_dark'])
+        parts['title'].configure(text=title)
+        parts['message'].configure(text=message)
+        parts['ok'].restyle("OK", T[color or 'accent_lavender'], T['text_light'])
+        self._show_dialog(parts['dialog'], 420, 280)
+    
+    def _build_fancy_message(self, dialog):
+        T = self.THEME
+        icon = tk.Label(dialog, font=self._font("Segoe UI", 42), bg=T['bg'])
+        icon.pack(pady=25)
         
-        tk.Label(dialog, text=icons.get(msg_type, "ℹ️"), font=("Segoe UI", 42),
-                bg=self.THEME['bg'], fg=colors.get(msg_type, self.THEME['text_dark'])).pack(pady=25)
+        title = tk.Label(dialog, font=("Georgia", 18, "bold"), bg=T['bg'], fg=T['text_dark'])
+        title.pack()
         
-        tk.Label(dialog, text=title, font=("Georgia", 18, "bold"),
-                bg=self.THEME['bg'], fg=self.THEME['text_dark']).pack()
+        message = tk.Label(dialog, font=("Segoe UI", 11), bg=T['bg'], fg=T['text_medium'],
+                           wraplength=360, justify='center')
+        message.pack(pady=18)
         
-        tk.Label(dialog, text=message, font=("Segoe UI", 11),
-                bg=self.THEME['bg'], fg=self.THEME['text_medium'],
-                wraplength=360, justify='center').pack(pady=18)
+        ok = StyledButton(dialog, "OK", lambda: self._hide_dialog(dialog),
+                          fg_color="white", font_size=10, padx=25, pady=8)
+        ok.pack(pady=10)
         
-        StyledButton(dialog, "OK", dialog.destroy,
-                    bg_color=colors.get(msg_type, self.THEME['accent_lavender']),
-                    hover_color=self.THEME['text_light'],
-                    fg_color="white", font_size=10, padx=25, pady=8).pack(pady=10)
+        return {'icon': icon, 'title': title, 'message': message, 'ok': ok}
 
 def main():
     root = tk.Tk()